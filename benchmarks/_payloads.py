@@ -0,0 +1,132 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import time
+
+from typing import Any, Dict, Tuple
+from nacl.signing import SigningKey
+
+from slashcord._json import JsonCodec
+
+
+PING = 1
+APPLICATION_COMMAND = 2
+
+
+class SignedPayloads:
+    def __init__(self, codec: JsonCodec, client_id: int = 0) -> None:
+        """Used to build interaction payloads signed like Discord does,
+           with a locally generated ed25519 keypair.
+
+        Parameters
+        ----------
+        codec : JsonCodec
+        client_id : int, optional
+            by default 0
+        """
+
+        self._codec = codec
+        self._client_id = str(client_id)
+        self._signing_key = SigningKey.generate()
+
+        self._ids = 0
+
+    @property
+    def public_key(self) -> str:
+        return self._signing_key.verify_key.encode().hex()
+
+    def _next_id(self) -> str:
+        self._ids += 1
+        return str(800000000000000000 + self._ids)
+
+    def ping(self) -> Dict[str, Any]:
+        return {
+            "id": self._next_id(),
+            "application_id": self._client_id,
+            "type": PING,
+            "token": "A" * 160,
+            "version": 1
+        }
+
+    def command(self, command_id: str, name: str,
+                guild_id: str = "700000000000000000") -> Dict[str, Any]:
+        return {
+            "id": self._next_id(),
+            "application_id": self._client_id,
+            "type": APPLICATION_COMMAND,
+            "token": "A" * 160,
+            "version": 1,
+            "guild_id": guild_id,
+            "channel_id": "710000000000000000",
+            "data": {
+                "id": command_id,
+                "name": name,
+                "options": [
+                    {"name": "choice", "type": 3, "value": "choice_1"}
+                ]
+            },
+            "member": {
+                "user": {
+                    "id": "720000000000000000",
+                    "username": "benchmark",
+                    "avatar": "a_d5efa99b3eeaa7dd43acca82f5692432",
+                    "discriminator": "0001",
+                    "public_flags": 131141
+                },
+                "roles": ["730000000000000000"],
+                "premium_since": None,
+                "permissions": "2147483647",
+                "pending": False,
+                "nick": None,
+                "mute": False,
+                "joined_at": "2017-03-13T19:19:14.040000+00:00",
+                "is_pending": False,
+                "deaf": False
+            }
+        }
+
+    def sign(self, payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+        """Used to encode & sign payload.
+
+        Parameters
+        ----------
+        payload : Dict[str, Any]
+
+        Returns
+        -------
+        Tuple[bytes, Dict[str, str]]
+            Body & headers.
+        """
+
+        body = self._codec.dumps(payload)
+        timestamp = str(int(time.time()))
+
+        signature = self._signing_key.sign(
+            timestamp.encode() + body
+        ).signature
+
+        return body, {
+            "X-Signature-Ed25519": signature.hex(),
+            "X-Signature-Timestamp": timestamp,
+            "Content-Type": "application/json"
+        }
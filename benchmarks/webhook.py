@@ -0,0 +1,350 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+
+from typing import Any, Dict, List, Tuple
+from aiohttp import ClientSession, TCPConnector
+
+from slashcord import (
+    SlashCord, Command, WebhookServer, HttpClientConfig, FakeDiscord,
+    WebhookModel
+)
+from slashcord._json import default_codec
+
+from ._payloads import SignedPayloads
+
+
+# Metrics where a bigger value is a regression.
+HIGHER_IS_WORSE = ("p50", "p99", "p999", "mean")
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Used to get percentile of sorted values.
+    """
+
+    if not values:
+        return 0.0
+
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+def summarize(latencies: List[float], seconds: float,
+              statuses: Dict[int, int]) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+
+    return {
+        "requests": len(latencies),
+        "seconds": seconds,
+        "rps": len(latencies) / seconds if seconds else 0.0,
+        "p50": percentile(latencies, 50) * 1000,
+        "p99": percentile(latencies, 99) * 1000,
+        "p999": percentile(latencies, 99.9) * 1000,
+        "statuses": {str(key): value for key, value in statuses.items()}
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def drive(url: str, requests: List[Tuple[bytes, Dict[str, str]]],
+                concurrency: int) -> Dict[str, Any]:
+    """Used to send signed requests through a real socket.
+
+    Parameters
+    ----------
+    url : str
+    requests : List[Tuple[bytes, Dict[str, str]]]
+        Signed bodies & headers.
+    concurrency : int
+        Requests in flight at once.
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+
+    latencies = []
+    statuses = {}
+    pending = iter(requests)
+
+    async with ClientSession(
+            connector=TCPConnector(limit=concurrency)) as session:
+
+        async def worker() -> None:
+            for body, headers in pending:
+                started = time.perf_counter()
+
+                async with session.post(url, data=body,
+                                        headers=headers) as resp:
+                    await resp.read()
+
+                latencies.append(time.perf_counter() - started)
+                statuses[resp.status] = statuses.get(resp.status, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+        seconds = time.perf_counter() - started
+
+    return summarize(latencies, seconds, statuses)
+
+
+async def stages(slash_cord: SlashCord, payloads: SignedPayloads,
+                 command_id: str, iterations: int) -> Dict[str, Any]:
+    """Used to time each step SlashCord takes per interaction.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Stage name to mean & p99 in microseconds.
+    """
+
+    timings = {
+        "verify": [],
+        "decode": [],
+        "model": [],
+        "route": [],
+        "dispatch": []
+    }
+
+    for _ in range(iterations):
+        body, headers = payloads.sign(
+            payloads.command(command_id, "benchmark")
+        )
+
+        started = time.perf_counter()
+        slash_cord._verify(
+            headers["X-Signature-Ed25519"],
+            headers["X-Signature-Timestamp"],
+            body
+        )
+        verified = time.perf_counter()
+        data = slash_cord._decode(body)
+        decoded = time.perf_counter()
+        webhook = WebhookModel(data)
+        built = time.perf_counter()
+        listeners = slash_cord._router.resolve(webhook)
+        routed = time.perf_counter()
+        await slash_cord._call_listeners(listeners, webhook)
+        dispatched = time.perf_counter()
+
+        timings["verify"].append(verified - started)
+        timings["decode"].append(decoded - verified)
+        timings["model"].append(built - decoded)
+        timings["route"].append(routed - built)
+        timings["dispatch"].append(dispatched - routed)
+
+    results = {}
+    for stage, values in timings.items():
+        values.sort()
+        results[stage] = {
+            "mean": sum(values) / len(values) * 1000000,
+            "p99": percentile(values, 99) * 1000000
+        }
+
+    return results
+
+
+async def run(requests: int, concurrency: int, ping: bool,
+              verify_workers: int = 0) -> Dict[str, Any]:
+    """Used to run every benchmark.
+
+    Parameters
+    ----------
+    requests : int
+        Requests per run.
+    concurrency : int
+        Requests in flight during the concurrent run.
+    ping : bool
+        Used to send PINGs instead of application commands.
+    verify_workers : int, optional
+        by default 0
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+
+    discord = FakeDiscord()
+    await discord.start()
+
+    payloads = SignedPayloads(default_codec())
+    port = free_port()
+
+    slash_cord = SlashCord(
+        token="",
+        client_id=0,
+        public_key=payloads.public_key,
+        webhook_server=WebhookServer(
+            "127.0.0.1", port, verify_workers=verify_workers
+        ),
+        http_client=HttpClientConfig(base_url=discord.base_url)
+    )
+
+    @slash_cord.listener(
+        Command("benchmark", "Command used to benchmark SlashCord")
+    )
+    async def benchmark(webhook: WebhookModel) -> None:
+        pass
+
+    await slash_cord.startup()
+
+    command_id = next(iter(discord.commands[None]))
+    url = "http://127.0.0.1:{}/".format(port)
+
+    def signed(count: int) -> List[Tuple[bytes, Dict[str, str]]]:
+        # Signed up front, so signing isn't measured.
+        return [
+            payloads.sign(
+                payloads.ping() if ping
+                else payloads.command(command_id, "benchmark")
+            ) for _ in range(count)
+        ]
+
+    try:
+        return {
+            "sequential": await drive(url, signed(requests), 1),
+            "concurrent": await drive(url, signed(requests), concurrency),
+            "stages": await stages(
+                slash_cord, payloads, command_id, requests
+            )
+        }
+    finally:
+        await slash_cord.shutdown()
+        await discord.close()
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float) -> List[str]:
+    """Used to find regressions against a baseline.
+
+    Returns
+    -------
+    List[str]
+        Description of each regression.
+    """
+
+    regressions = []
+
+    def check(name: str, metric: str, value: float, base: float) -> None:
+        if not base:
+            return
+
+        if metric in HIGHER_IS_WORSE:
+            regressed = value > base * (1 + tolerance)
+        else:
+            regressed = value < base * (1 - tolerance)
+
+        if regressed:
+            regressions.append("{} {}: {:.2f} vs baseline {:.2f}".format(
+                name, metric, value, base
+            ))
+
+    for run_ in ("sequential", "concurrent"):
+        for metric in ("rps", "p99"):
+            check(
+                run_, metric, results[run_][metric], baseline[run_][metric]
+            )
+
+    for stage, values in results["stages"].items():
+        if stage in baseline["stages"]:
+            check(
+                stage, "mean", values["mean"],
+                baseline["stages"][stage]["mean"]
+            )
+
+    return regressions
+
+
+def report(results: Dict[str, Any]) -> None:
+    for run_ in ("sequential", "concurrent"):
+        result = results[run_]
+        print(
+            "{:<10} {:>8} reqs {:>10.1f} req/s  p50 {:>7.2f}ms  "
+            "p99 {:>7.2f}ms  p999 {:>7.2f}ms  {}".format(
+                run_, result["requests"], result["rps"], result["p50"],
+                result["p99"], result["p999"], result["statuses"]
+            )
+        )
+
+    print()
+    for stage, result in results["stages"].items():
+        print("{:<10} mean {:>9.1f}us  p99 {:>9.1f}us".format(
+            stage, result["mean"], result["p99"]
+        ))
+
+
+def main() -> None:
+    cli = argparse.ArgumentParser(
+        description="Benchmark SlashCord's webhook server end to end."
+    )
+
+    cli.add_argument("--requests", type=int, default=2000)
+    cli.add_argument("--concurrency", type=int, default=64)
+    cli.add_argument("--ping", action="store_true",
+                     help="Send PINGs instead of application commands")
+    cli.add_argument("--verify-workers", type=int, default=0,
+                     help="Threads to verify signatures in")
+    cli.add_argument("--save", type=str, default="",
+                     help="Write results to JSON file")
+    cli.add_argument("--compare", type=str, default="",
+                     help="Fail if results regress against JSON file")
+    cli.add_argument("--tolerance", type=float, default=0.15,
+                     help="Allowed regression before failing")
+
+    args = cli.parse_args()
+
+    results = asyncio.get_event_loop().run_until_complete(
+        run(args.requests, args.concurrency, args.ping,
+            args.verify_workers)
+    )
+
+    report(results)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+        if regressions:
+            print()
+            print("Regressions:")
+            for regression in regressions:
+                print("  " + regression)
+
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
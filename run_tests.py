@@ -25,12 +25,46 @@ import unittest
 import argparse
 import sys
 
-from slashcord.tests import TestSlashCord
+from slashcord.tests import (
+    TestSlashCord,
+    TestFrozenCommand,
+    TestRateLimiter,
+    TestCommandRegistry,
+    TestCommandCache,
+    TestInteractionCache,
+    TestMetrics,
+    TestOutboundQueue,
+    TestHttpClientConfig,
+    TestRetryPolicy,
+    TestJsonCodec,
+    TestWebhook,
+    TestRouter,
+    TestInteractions,
+    TestWorkers
+)
+
+assert TestFrozenCommand
+assert TestRateLimiter
+assert TestCommandRegistry
+assert TestCommandCache
+assert TestInteractionCache
+assert TestMetrics
+assert TestOutboundQueue
+assert TestHttpClientConfig
+assert TestRetryPolicy
+assert TestJsonCodec
+assert TestWebhook
+assert TestRouter
+assert TestInteractions
+assert TestWorkers
 
 
 cli = argparse.ArgumentParser()
 
-cli.add_argument("--token", type=str, default="")
+cli.add_argument(
+    "--token", type=str, default="",
+    help="Leave empty to test against FakeDiscord"
+)
 cli.add_argument("--client_id", type=int, default=0)
 cli.add_argument("--public_key", type=str, default="")
 cli.add_argument("--guild_id", type=int, default=0)
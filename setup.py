@@ -31,12 +31,15 @@ setup(
     author=get_variable("__author__"),
     author_email=get_variable("__author_email__"),
     install_requires=get_requirements(),
+    extras_require={
+        "orjson": ["orjson"]
+    },
     license=get_variable("__license__"),
     packages=[
         "slashcord",
         "slashcord.http"
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     include_package_data=True,
     zip_safe=False
 )
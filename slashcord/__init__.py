@@ -22,54 +22,105 @@ SOFTWARE.
 """
 
 import aiojobs
+import asyncio
+import logging
+import os
+import time
+
+from functools import partial
+from typing import (
+    Callable, Coroutine, List, AsyncGenerator, Optional, Dict, Union,
+    Iterable
+)
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 
-from typing import Coroutine, List, AsyncGenerator
-from functools import wraps
-from aiohttp import ClientSession
-
-from json import JSONDecodeError, JSONDecoder
-
-from nacl.signing import VerifyKey
-from nacl.exceptions import BadSignatureError
+from nacl.bindings import crypto_sign_open, crypto_sign_BYTES
+from nacl.exceptions import CryptoError
 
 from ._settings import (
     Command,
+    FrozenCommand,
+    encode_commands,
     CommandChoice,
-    WebhookServer
+    WebhookServer,
+    HttpClientConfig,
+    RetryPolicy
 )
 from ._exceptions import (
     SlashCordException,
     HttpException,
+    RateLimited,
     CommandConfigException,
     InvalidName,
     InvalidDescription,
     InvalidChoiceName,
+    TooManyOptions,
+    TooManyChoices,
+    MissingOptionType,
+    CommandTooLong,
     WebhookException,
     InvalidSignature,
     InvalidJson,
-    StartupNotCalled
+    StartupNotCalled,
+    OutboundQueueFull
 )
 from ._guild import Guild
-from ._models import WebhookModel, CommandModel
-from ._message import Message, Embed
-from .http import HttpClient, HttpServer
+from ._registry import CommandRegistry, SyncReport, command_changed
+from ._router import Router
+from ._cache import CommandCache
+from ._deploy import DeployState, DeployResult
+from ._metrics import Metrics
+from ._hooks import Hook
+from ._dedup import (
+    InteractionCache,
+    MemoryInteractionCache,
+    SharedInteractionCache
+)
+from ._json import JsonCodec, StdlibJsonCodec, OrjsonCodec, default_codec
+from ._models import REQUIRED_FIELDS, WebhookModel, CommandModel
+from ._message import Message, Embed, Response
+from .http import (
+    HttpClient,
+    HttpServer,
+    RateLimiter,
+    OutboundQueue,
+    FakeDiscord,
+    WorkerSupervisor
+)
 
 assert Command, CommandChoice
+assert FrozenCommand
 assert WebhookServer
+assert HttpClientConfig, RetryPolicy
 assert Message, Embed
+assert Response
 
 assert SlashCordException
 assert HttpException
+assert RateLimited
 assert CommandConfigException
 assert InvalidName
 assert InvalidDescription
 assert InvalidChoiceName
+assert TooManyOptions, TooManyChoices
+assert MissingOptionType, CommandTooLong
 assert WebhookException
 assert InvalidSignature
 assert InvalidJson
 assert StartupNotCalled
+assert OutboundQueueFull
 
 assert WebhookModel
+assert FakeDiscord
+
+assert CommandCache
+assert InteractionCache
+assert MemoryInteractionCache, SharedInteractionCache
+assert Hook
+assert JsonCodec, StdlibJsonCodec
+assert OrjsonCodec
+assert SyncReport
+assert DeployState, DeployResult
 
 
 __version__ = "0.0.2"
@@ -84,7 +135,10 @@ class SlashCord(HttpClient):
     BASE_URL = "https://discord.com/api/v8/"
 
     def __init__(self, token: str, client_id: int, public_key: str,
-                 webhook_server: WebhookServer = WebhookServer()) -> None:
+                 webhook_server: WebhookServer = WebhookServer(),
+                 command_cache: Optional[CommandCache] = None,
+                 http_client: HttpClientConfig = HttpClientConfig(),
+                 json_codec: Optional[JsonCodec] = None) -> None:
         """Wrapper for Discord's slash commands!
 
         Parameters
@@ -99,6 +153,15 @@ class SlashCord(HttpClient):
         webhook_server : WebhookServer, optional
             Used to configure webhook server, set as None to disable.
             by default WebhookServer()
+        command_cache : Optional[CommandCache], optional
+            Used to skip registering unchanged commands on startup,
+            by default None
+        http_client : HttpClientConfig, optional
+            Used to configure connection pooling & timeouts,
+            by default HttpClientConfig()
+        json_codec : Optional[JsonCodec], optional
+            Used to encode & decode JSON, by default orjson
+            if installed otherwise the json module.
 
         Notes
         -----
@@ -132,67 +195,192 @@ class SlashCord(HttpClient):
         self._auth += token
 
         if webhook_server:
-            self._server = HttpServer(
-                webhook_server._ip, webhook_server._port, self
-            )
+            self._server = HttpServer(webhook_server, self)
         else:
             self._server = None
 
         self._requests = None
+        self._http_config = http_client
+
+        if http_client._base_url:
+            self.BASE_URL = http_client._base_url
+        self._json = json_codec or default_codec()
+        self._ratelimiter = RateLimiter()
+        self._queue = OutboundQueue(
+            http_client._concurrency, http_client._max_queued
+        )
+        self._metrics = Metrics()
+        self._hooks: List[Hook] = []
 
         self._client_id = client_id
-        self._verify_key = VerifyKey(bytes.fromhex(public_key))
+        self._public_key = bytes.fromhex(public_key)
 
         # Used for decorator
-        # {
-        #   "command_id": List[Coroutine],
-        # }
-        self._global_funcs = {}
+        self._router = Router()
 
-        # Used for decorator
-        # {
-        #   "guild_id": {
-        #       "command_id": List[Coroutine],
-        #    }
-        # }
-        self._guild_funcs = {}
-
-    async def startup(self) -> None:
+        self._registry = CommandRegistry()
+        self._command_cache = command_cache
+
+        self._error_handlers: List[Callable] = []
+
+    async def startup(self, register_commands: bool = True) -> None:
         """Used to start up SlashCord, must be called
            before making any other calls.
 
+        Parameters
+        ----------
+        register_commands : bool, optional
+            Used to bulk overwrite declared commands,
+            set as False if calling self.sync_commands instead.
+            by default True
+
         Notes
         -----
         Should only be called once.
         """
 
-        # ClientSession should be created within
-        # context of event loop.
-        self._requests = ClientSession(
-            headers={"Authorization": self._auth}
-        )
+        self._open_session()
+
+        if register_commands:
+            await self._sync_registry()
 
         if self._server:
-            self._scheduler = await aiojobs.create_scheduler()
+            self._scheduler = await aiojobs.create_scheduler(
+                limit=self._server._limit,
+                pending_limit=self._server._pending_limit
+            )
             await self._server.start()
 
-    async def shutdown(self) -> None:
+    async def shutdown(self, timeout: float = 30.0) -> None:
         """Close underlying sessions.
 
+        Parameters
+        ----------
+        timeout : float, optional
+            Seconds running listeners & follow ups have to finish
+            before they're cancelled, by default 30.0
+
         Notes
         -----
         Should only be called once.
+
+        New requests are refused first, the session is closed last
+        so listeners can still send responses while finishing.
         """
 
         assert self._requests
-        await self._requests.close()
 
         if self._server:
+            await self._server.stop()
+
+            # Scheduler.wait_and_close needs aiojobs 1.2 & Python 3.8,
+            # listeners can spawn more jobs while draining.
+            loop = asyncio.get_event_loop()
+            deadline = loop.time() + timeout
+            while len(self._scheduler) and loop.time() < deadline:
+                await asyncio.sleep(0.05)
+
             await self._scheduler.close()
             await self._server.close()
 
+        await self._close_session()
+
+    def _open_session(self) -> None:
+        """Used to create or attach the outbound ClientSession.
+        """
+
+        config = self._http_config
+
+        if config._session:
+            self._requests = config._session
+        else:
+            if config._connector:
+                connector = config._connector
+            else:
+                connector = TCPConnector(
+                    limit=config._limit,
+                    limit_per_host=config._limit_per_host,
+                    use_dns_cache=config._use_dns_cache,
+                    ttl_dns_cache=config._ttl_dns_cache,
+                    keepalive_timeout=config._keepalive_timeout
+                )
+
+            # ClientSession should be created within
+            # context of event loop.
+            self._requests = ClientSession(
+                connector=connector,
+                connector_owner=not config._connector,
+                timeout=ClientTimeout(
+                    total=config._timeout,
+                    connect=config._connect_timeout
+                )
+            )
+
+    async def _close_session(self) -> None:
+        """Used to close the outbound ClientSession if owned.
+        """
+
+        if not self._http_config._session:
+            await self._requests.close()
+
+    async def _register(self) -> None:
+        """Used to only register declared commands, for the
+           parent process of self.run_workers.
+        """
+
+        self._open_session()
+
+        try:
+            await self._sync_registry()
+        finally:
+            await self._close_session()
+            self._requests = None
+
+    def run_workers(self, workers: int = None,
+                    health_interval: float = 1.0,
+                    health_timeout: float = 10.0,
+                    shutdown_timeout: float = 30.0) -> None:
+        """Used to serve webhooks from many processes sharing
+           the webhook port through SO_REUSEPORT, blocking until
+           SIGINT or SIGTERM.
+
+        Parameters
+        ----------
+        workers : int, optional
+            by default os.cpu_count()
+        health_interval : float, optional
+            Seconds between health checks, by default 1.0
+        health_timeout : float, optional
+            Seconds without a heartbeat before a worker is
+            restarted, by default 10.0
+        shutdown_timeout : float, optional
+            Seconds a worker has to finish requests before
+            being killed, by default 30.0
+
+        Notes
+        -----
+        Should be called instead of self.startup, commands are
+        registered once in this process before workers are forked.
+
+        Send SIGHUP for a graceful rolling restart of the workers.
+
+        Only supported where os.fork & SO_REUSEPORT are, e.g. Linux.
+        """
+
+        assert self._server
+        assert not (self._http_config._session or
+                    self._http_config._connector), \
+            "Sessions can't be shared between worker processes"
+
+        WorkerSupervisor(
+            self, workers or os.cpu_count() or 1,
+            health_interval, health_timeout, shutdown_timeout
+        ).run()
+
     async def _call_listeners(self, funcs: List[Coroutine],
-                              webhook: WebhookModel) -> None:
+                              webhook: WebhookModel,
+                              respond: Callable = None
+                              ) -> Optional[Union[Message, Response]]:
         """Used to call listeners.
 
         Parameters
@@ -201,46 +389,294 @@ class SlashCord(HttpClient):
             List of funcs to call.
         webhook : WebhookModel
             WebhookModel to pass.
+        respond : Callable, optional
+            Called with the first Message or Response as soon as a
+            listener returns it, while the other listeners keep running.
+
+        Returns
+        -------
+        Optional[Union[Message, Response]]
+            First Message or Response returned by a listener.
 
         Notes
         -----
-        Should be spawned with self._scheduler.spawn
+        Should be spawned with self._scheduler.spawn, only returns
+        once every listener has finished.
         """
 
         assert self._server
 
-        for func in funcs:
-            func(webhook=webhook)
+        tasks = [
+            asyncio.ensure_future(self.__call_listener(func, webhook))
+            for func in funcs
+        ]
+
+        response = None
+
+        try:
+            for task in asyncio.as_completed(tasks):
+                result = await task
+
+                if response is None \
+                        and isinstance(result, (Message, Response)):
+                    response = result
+
+                    if respond:
+                        respond(response)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return response
+
+    async def __call_listener(self, func: Callable,
+                              webhook: WebhookModel) -> object:
+        """Used to call a listener, isolating its exceptions.
+
+        Parameters
+        ----------
+        func : Callable
+        webhook : WebhookModel
+
+        Returns
+        -------
+        object
+            What the listener returned, None if it failed.
+        """
+
+        started = time.perf_counter()
+
+        hooks = self._hooks
+        if hooks:
+            contexts = [hook.listener_start(webhook, func) for hook in hooks]
+
+        if asyncio.iscoroutinefunction(func):
+            call = func(webhook=webhook)
+        else:
+            # Sync listeners run in the default thread pool,
+            # timing out doesn't stop their thread.
+            call = asyncio.get_event_loop().run_in_executor(
+                None, partial(func, webhook=webhook)
+            )
+
+        failed = None
+
+        try:
+            result = await asyncio.wait_for(
+                call, self._server._listener_timeout
+            )
+
+            if asyncio.iscoroutine(result):
+                result = await result
+
+            return result
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            failed = error
+            await self._error(error, webhook, func)
+        finally:
+            duration = time.perf_counter() - started
+            self._metrics.listener_durations.observe(
+                duration, webhook.data.name
+            )
+
+            if hooks:
+                for hook, context in zip(hooks, contexts):
+                    hook.listener_end(
+                        context, webhook, func, duration, failed
+                    )
+
+        return None
+
+    async def _error(self, error: Exception, webhook: WebhookModel,
+                     func: Callable) -> None:
+        """Used to report an exception raised by a listener.
+
+        Parameters
+        ----------
+        error : Exception
+        webhook : WebhookModel
+        func : Callable
+            Listener which raised.
+        """
+
+        if not self._error_handlers:
+            logging.error(
+                "Listener {!r} failed".format(func),
+                exc_info=error
+            )
+            return
+
+        for handler in self._error_handlers:
+            try:
+                result = handler(error, webhook, func)
+
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logging.exception("Error handler failed")
+
+    def _scope(self, guild_id: Optional[str]) -> Union["SlashCord", Guild]:
+        return self if guild_id is None else self.guild(guild_id)
+
+    def _map_listeners(self, guild_id: Optional[str],
+                       ids: Dict[str, str]) -> None:
+        """Used to route command ids to their listeners.
+
+        Parameters
+        ----------
+        guild_id : Optional[str]
+        ids : Dict[str, str]
+            Command name to id.
+        """
+
+        for name, command_id in ids.items():
+            self._router.add(
+                guild_id, name, command_id,
+                self._registry.listeners(name, guild_id)
+            )
 
-    def listener(self, command: Command):
+    async def _sync_registry(self) -> None:
+        """Used to bulk overwrite every scope in the registry
+           & map the returned command ids to their listeners.
+
+        Notes
+        -----
+        Scopes with no changes since the last sync are
+        skipped if a CommandCache was given.
+        """
+
+        async def sync_scope(guild_id: Optional[str]) -> None:
+            # Frozen once, so the cache & request reuse the encoding.
+            commands = [
+                command.freeze()
+                for command in self._registry.commands(guild_id)
+            ]
+            scope = self._scope(guild_id)
+
+            ids = self._command_cache.lookup(
+                scope._pathway, commands
+            ) if self._command_cache else None
+
+            if ids is None:
+                ids = {
+                    model.name: model.id for model in
+                    await scope.bulk_overwrite_commands(commands)
+                }
+
+                if self._command_cache:
+                    self._command_cache.store(scope._pathway, commands, ids)
+
+            self._map_listeners(guild_id, ids)
+
+        await asyncio.gather(*[
+            sync_scope(guild_id) for guild_id in self._registry.scopes()
+        ])
+
+        if self._command_cache:
+            self._command_cache.save()
+
+    def listener(self, command: Command, path: str = ""):
         """Used to listen to command.
 
         Parameters
         ----------
         command : Command
+        path : str, optional
+            Used to only listen to a sub command,
+            e.g. 'group sub_command', by default ""
 
         Notes
         -----
         Webhook server must be enabled.
+
+        Listeners must be declared before self.startup is called,
+        every command in a scope is registered with one request.
         """
 
         assert self._server
 
         def decorator(func):
-            @wraps(func)
-            async def _add_listener(*args, **kwargs):
-                # Keep it simple and just overwrite the command
-                # every time the script is started.
-                command_id = (await self.create_command(command)).id
+            self._registry.add(command, func, path=tuple(path.split()))
 
-                if command_id not in self._global_funcs:
-                    self._global_funcs[command_id] = []
+            return func
 
-                self._global_funcs[command_id].append(func)
+        return decorator
 
-            return _add_listener
+    def add_hook(self, hook: Hook) -> None:
+        """Used to trace or profile requests, listeners
+           & calls to Discord's API.
 
-        return decorator
+        Parameters
+        ----------
+        hook : Hook
+        """
+
+        self._hooks.append(hook)
+
+    def error_handler(self, func: Callable) -> Callable:
+        """Used to handle exceptions raised by listeners,
+           including asyncio.TimeoutError.
+
+        Parameters
+        ----------
+        func : Callable
+            Called with the exception, the WebhookModel & listener.
+
+        Notes
+        -----
+        Exceptions are logged if no error handlers are added.
+        """
+
+        self._error_handlers.append(func)
+
+        return func
+
+    def _verify(self, ed25519: str, timestamp: str, body: bytes) -> None:
+        """Used to verify webhook signature.
+
+        Raises
+        ------
+        InvalidSignature
+        """
+
+        try:
+            signature = bytes.fromhex(ed25519)
+        except ValueError:
+            raise InvalidSignature()
+
+        if len(signature) != crypto_sign_BYTES:
+            raise InvalidSignature()
+
+        # Signed message is built with one copy, instead of
+        # VerifyKey.verify concatenating the signature again.
+        try:
+            crypto_sign_open(
+                b"".join((signature, timestamp.encode(), body)),
+                self._public_key
+            )
+        except CryptoError:
+            raise InvalidSignature()
+
+    def _decode(self, body: bytes) -> dict:
+        """Used to decode webhook body.
+
+        Raises
+        ------
+        InvalidJson
+        """
+
+        try:
+            data = self._json.loads(body)
+        except ValueError:
+            raise InvalidJson()
+
+        # Models are lazy, so check the fields they need upfront.
+        if not isinstance(data, dict) or not data.keys() >= REQUIRED_FIELDS:
+            raise InvalidJson()
+
+        return data
 
     def webhook(self, ed25519: str, timestamp: str,
                 body: bytes) -> WebhookModel:
@@ -266,20 +702,9 @@ class SlashCord(HttpClient):
         WebhookModel
         """
 
-        try:
-            self._verify_key.verify(
-                (ed25519 + str(body)).encode(),
-                bytes.fromhex(timestamp)
-            )
-        except BadSignatureError:
-            raise InvalidSignature()
-
-        try:
-            json = JSONDecoder(body)
-        except JSONDecodeError:
-            raise InvalidJson()
+        self._verify(ed25519, timestamp, body)
 
-        return WebhookModel(**json)
+        return WebhookModel(self._decode(body))
 
     def guild(self, guild_id: str) -> Guild:
         """Used to interact with guild.
@@ -295,6 +720,10 @@ class SlashCord(HttpClient):
 
         return Guild(self, guild_id)
 
+    @property
+    def _pathway(self) -> str:
+        return "applications/{}/commands".format(self._client_id)
+
     async def commands(self) -> AsyncGenerator[CommandModel, None]:
         """Used to list global commands.
 
@@ -303,9 +732,7 @@ class SlashCord(HttpClient):
         CommandModel
         """
 
-        data = await self._get(
-            "applications/{}/commands".format(self._client_id)
-        )
+        data = await self._get(self._pathway)
 
         for command in data:
             yield CommandModel(**command)
@@ -325,8 +752,276 @@ class SlashCord(HttpClient):
         return CommandModel(
             **(
                 await self._post(
-                    "applications/{}/commands".format(self._client_id),
-                    payload=command._payload
+                    self._pathway, payload=command.freeze()._json
+                )
+            )
+        )
+
+    async def bulk_overwrite_commands(self, commands: List[Command]
+                                      ) -> List[CommandModel]:
+        """Used to overwrite all global commands with one request.
+
+        Parameters
+        ----------
+        commands : List[Command]
+
+        Returns
+        -------
+        List[CommandModel]
+        """
+
+        return [
+            CommandModel(**command) for command in await self._put(
+                self._pathway,
+                payload=encode_commands(commands)
+            )
+        ]
+
+    async def edit_command(self, command_id: str,
+                           command: Command) -> CommandModel:
+        """Used to edit a global command.
+
+        Parameters
+        ----------
+        command_id : str
+        command : Command
+
+        Returns
+        -------
+        CommandModel
+        """
+
+        return CommandModel(
+            **(
+                await self._patch(
+                    "{}/{}".format(self._pathway, command_id),
+                    payload=command.freeze()._json
                 )
             )
         )
+
+    async def delete_command(self, command_id: str) -> None:
+        """Used to delete a global command.
+
+        Parameters
+        ----------
+        command_id : str
+        """
+
+        await self._delete("{}/{}".format(self._pathway, command_id))
+
+    async def deploy_commands(self, commands: List[Command],
+                              guild_ids: Iterable[Union[str, int]],
+                              concurrency: int = 10,
+                              state: Optional[DeployState] = None
+                              ) -> AsyncGenerator[DeployResult, None]:
+        """Used to overwrite the commands of many guilds,
+           deploying to several guilds at once.
+
+        Parameters
+        ----------
+        commands : List[Command]
+        guild_ids : Iterable[Union[str, int]]
+        concurrency : int, optional
+            Guilds to deploy to at once, by default 10
+        state : Optional[DeployState], optional
+            Pass the same state again to resume a deploy,
+            skipping guilds already deployed to, by default None
+
+        Yields
+        -------
+        DeployResult
+            Per guild as each finishes, failed guilds
+            don't stop the deploy.
+
+        Notes
+        -----
+        Requests still go through the rate limiter &
+        outbound queue, at management priority.
+        """
+
+        if state is None:
+            state = DeployState()
+
+        # Validated & encoded once for every guild.
+        commands = [command.freeze() for command in commands]
+        state.begin(commands)
+
+        pending = (
+            guild_id for guild_id in map(str, guild_ids)
+            if not state.completed(guild_id)
+        )
+        results: asyncio.Queue = asyncio.Queue()
+
+        async def deploy() -> None:
+            try:
+                # Workers share one iterator, so each guild is taken once.
+                for guild_id in pending:
+                    try:
+                        models = await self.guild(
+                            guild_id
+                        ).bulk_overwrite_commands(commands)
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as error:
+                        result = DeployResult(guild_id, error=error)
+                    else:
+                        state.complete(guild_id)
+                        result = DeployResult(guild_id, models)
+
+                    results.put_nowait(result)
+            finally:
+                results.put_nowait(None)
+
+        workers = [
+            asyncio.ensure_future(deploy()) for _ in range(concurrency)
+        ]
+        running = len(workers)
+
+        try:
+            while running:
+                result = await results.get()
+
+                if result is None:
+                    running -= 1
+                else:
+                    yield result
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+            state.save()
+
+    async def sync_commands(self) -> SyncReport:
+        """Used to sync declared commands with Discord,
+           only sending requests for commands which differ.
+
+        Returns
+        -------
+        SyncReport
+
+        Notes
+        -----
+        Only scopes with declared listeners are synced,
+        commands in those scopes which aren't declared are deleted.
+
+        self.startup should be called with register_commands=False
+        when using this.
+        """
+
+        report = SyncReport()
+
+        async def sync_scope(guild_id: Optional[str]) -> None:
+            scope = self._scope(guild_id)
+            commands = [
+                command.freeze()
+                for command in self._registry.commands(guild_id)
+            ]
+
+            existing = {model.name: model async for model in scope.commands()}
+            ids = {}
+
+            async def create(command: Command) -> None:
+                ids[command._name] = (await scope.create_command(command)).id
+                report.created.append((guild_id, command._name))
+
+            async def edit(model: CommandModel, command: Command) -> None:
+                await scope.edit_command(model.id, command)
+                report.updated.append((guild_id, command._name))
+
+            async def delete(model: CommandModel) -> None:
+                await scope.delete_command(model.id)
+                report.deleted.append((guild_id, model.name))
+
+            changes = []
+            for command in commands:
+                model = existing.pop(command._name, None)
+
+                if model is None:
+                    changes.append(create(command))
+                    continue
+
+                ids[command._name] = model.id
+
+                if command_changed(model, command):
+                    changes.append(edit(model, command))
+                else:
+                    report.unchanged.append((guild_id, command._name))
+
+            changes += [delete(model) for model in existing.values()]
+
+            await asyncio.gather(*changes)
+
+            if self._command_cache:
+                self._command_cache.store(scope._pathway, commands, ids)
+
+            self._map_listeners(guild_id, ids)
+
+        await asyncio.gather(*[
+            sync_scope(guild_id) for guild_id in self._registry.scopes()
+        ])
+
+        if self._command_cache:
+            self._command_cache.save()
+
+        return report
+
+    async def create_followup_message(self, token: str,
+                                      message: Message) -> dict:
+        """Used to send a follow up message to an interaction.
+
+        Parameters
+        ----------
+        token : str
+            Interaction token.
+        message : Message
+
+        Returns
+        -------
+        dict
+            Message created.
+        """
+
+        return await self._post(
+            "webhooks/{}/{}".format(self._client_id, token),
+            payload=message._interaction_payload
+        )
+
+    async def edit_original_response(self, token: str,
+                                     message: Message) -> dict:
+        """Used to edit the original response to an interaction,
+           e.g. to fill in a deferred response.
+
+        Parameters
+        ----------
+        token : str
+            Interaction token.
+        message : Message
+
+        Returns
+        -------
+        dict
+            Message edited.
+        """
+
+        return await self._patch(
+            "webhooks/{}/{}/messages/@original".format(
+                self._client_id, token
+            ),
+            payload=message._interaction_payload
+        )
+
+    async def delete_original_response(self, token: str) -> None:
+        """Used to delete the original response to an interaction.
+
+        Parameters
+        ----------
+        token : str
+            Interaction token.
+        """
+
+        await self._delete(
+            "webhooks/{}/{}/messages/@original".format(
+                self._client_id, token
+            )
+        )
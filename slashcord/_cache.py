@@ -0,0 +1,145 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import json
+
+from typing import Dict, List, Optional
+
+from ._settings import Command
+
+
+def fingerprint(command: Command) -> str:
+    """Used to get a stable hash of a command's payload.
+
+    Parameters
+    ----------
+    command : Command
+
+    Returns
+    -------
+    str
+    """
+
+    return command.freeze()._hash
+
+
+class CommandCache:
+    def __init__(self, path: str = ".slashcord-cache.json") -> None:
+        """Used to remember which commands have already been
+           registered, so unchanged scopes skip the network on startup.
+
+        Parameters
+        ----------
+        path : str, optional
+            File to store cache in, by default ".slashcord-cache.json"
+
+        Notes
+        -----
+        Commands changed outside of SlashCord won't be noticed,
+        delete the file or call self.clear to force a sync.
+        """
+
+        self._path = path
+
+        # {
+        #   "scope pathway": {
+        #       "command_name": {"hash": str, "id": str},
+        #   }
+        # }
+        self._scopes: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+        if os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    self._scopes = json.load(f)
+            except (OSError, ValueError):
+                self._scopes = {}
+
+    def lookup(self, scope: str,
+               commands: List[Command]) -> Optional[Dict[str, str]]:
+        """Used to get cached command ids for scope.
+
+        Parameters
+        ----------
+        scope : str
+            Pathway of scope.
+        commands : List[Command]
+
+        Returns
+        -------
+        Optional[Dict[str, str]]
+            Command name to id, None if any command
+            has been added, removed or changed.
+        """
+
+        cached = self._scopes.get(scope)
+        if not cached or len(cached) != len(commands):
+            return None
+
+        ids = {}
+        for command in commands:
+            if (command._name not in cached or
+                    cached[command._name]["hash"] != fingerprint(command)):
+                return None
+
+            ids[command._name] = cached[command._name]["id"]
+
+        return ids
+
+    def store(self, scope: str, commands: List[Command],
+              ids: Dict[str, str]) -> None:
+        """Used to store command ids for scope.
+
+        Parameters
+        ----------
+        scope : str
+            Pathway of scope.
+        commands : List[Command]
+        ids : Dict[str, str]
+            Command name to id.
+        """
+
+        self._scopes[scope] = {
+            command._name: {
+                "hash": fingerprint(command),
+                "id": ids[command._name]
+            } for command in commands
+        }
+
+    def clear(self) -> None:
+        """Used to forget every cached command.
+        """
+
+        self._scopes = {}
+        self.save()
+
+    def save(self) -> None:
+        """Used to write cache to disk.
+        """
+
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(self._scopes, f)
+
+        os.replace(temp_path, self._path)
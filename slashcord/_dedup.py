@@ -0,0 +1,218 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import time
+import asyncio
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional
+from multiprocessing import Manager
+from multiprocessing.managers import SyncManager
+
+
+# Returned by claim while an earlier delivery is still being handled.
+IN_FLIGHT = b""
+
+
+class InteractionCache(ABC):
+    """Used to remember responses by interaction id, so redelivered
+       interactions don't call listeners again.
+    """
+
+    @abstractmethod
+    async def claim(self, interaction_id: str) -> Optional[bytes]:
+        """Used to claim an interaction before handling it.
+
+        Parameters
+        ----------
+        interaction_id : str
+
+        Returns
+        -------
+        Optional[bytes]
+            None if claimed, otherwise the cached response body
+            or IN_FLIGHT.
+        """
+
+    @abstractmethod
+    async def store(self, interaction_id: str, body: bytes) -> None:
+        """Used to store the response body of a claimed interaction.
+
+        Parameters
+        ----------
+        interaction_id : str
+        body : bytes
+        """
+
+    @abstractmethod
+    async def release(self, interaction_id: str) -> None:
+        """Used to forget a claimed interaction which wasn't handled.
+
+        Parameters
+        ----------
+        interaction_id : str
+        """
+
+
+class MemoryInteractionCache(InteractionCache):
+    def __init__(self, ttl: float = 900.0, max_size: int = 10000) -> None:
+        """Used to de-duplicate interactions within one process.
+
+        Parameters
+        ----------
+        ttl : float, optional
+            Seconds to remember interactions, by default 900.0
+        max_size : int, optional
+            Interactions to remember, by default 10000
+        """
+
+        self._ttl = ttl
+        self._max_size = max_size
+
+        # {
+        #   "interaction_id": (expires, body),
+        # }
+        # Oldest first, as every entry has the same ttl.
+        self._entries: OrderedDict = OrderedDict()
+
+    def __evict(self, now: float) -> None:
+        while self._entries:
+            expires, _ = next(iter(self._entries.values()))
+            if expires > now and len(self._entries) < self._max_size:
+                break
+
+            self._entries.popitem(last=False)
+
+    async def claim(self, interaction_id: str) -> Optional[bytes]:
+        now = time.monotonic()
+
+        entry = self._entries.get(interaction_id)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        self.__evict(now)
+
+        self._entries[interaction_id] = (now + self._ttl, IN_FLIGHT)
+        self._entries.move_to_end(interaction_id)
+
+        return None
+
+    async def store(self, interaction_id: str, body: bytes) -> None:
+        entry = self._entries.get(interaction_id)
+
+        self._entries[interaction_id] = (
+            entry[0] if entry else time.monotonic() + self._ttl, body
+        )
+
+    async def release(self, interaction_id: str) -> None:
+        self._entries.pop(interaction_id, None)
+
+
+class SharedInteractionCache(InteractionCache):
+    def __init__(self, ttl: float = 900.0, max_size: int = 10000,
+                 manager: Optional[SyncManager] = None) -> None:
+        """Used to de-duplicate interactions across worker processes.
+
+        Parameters
+        ----------
+        ttl : float, optional
+            Seconds to remember interactions, by default 900.0
+        max_size : int, optional
+            Interactions to remember, by default 10000
+        manager : Optional[SyncManager], optional
+            Started manager to store interactions in,
+            by default one is started.
+
+        Notes
+        -----
+        Must be created before SlashCord.run_workers forks, so every
+        worker shares the same manager process.
+        """
+
+        self._ttl = ttl
+        self._max_size = max_size
+
+        self._manager = manager or Manager()
+
+        # {
+        #   "interaction_id": (expires, body, claim token),
+        # }
+        self._entries = self._manager.dict()
+        # Interaction ids in the order they were added, oldest first.
+        self._order = self._manager.list()
+
+    async def __run(self, func, *args):
+        # Manager calls block on a socket.
+        return await asyncio.get_event_loop().run_in_executor(
+            None, func, *args
+        )
+
+    def __claim(self, interaction_id: str) -> Optional[bytes]:
+        now = time.time()
+        entry = (now + self._ttl, IN_FLIGHT, os.urandom(8))
+
+        # setdefault is atomic within the manager process.
+        existing = self._entries.setdefault(interaction_id, entry)
+        if existing == entry:
+            self.__added(interaction_id)
+            return None
+
+        if existing[0] <= now:
+            self._entries[interaction_id] = entry
+            return None
+
+        return existing[1]
+
+    def __added(self, interaction_id: str) -> None:
+        self._order.append(interaction_id)
+
+        # Evicts the oldest ids first, each costing one manager call
+        # rather than copying every entry out of the manager.
+        while len(self._order) > self._max_size:
+            self._entries.pop(self._order.pop(0), None)
+
+    def __store(self, interaction_id: str, body: bytes) -> None:
+        added = interaction_id not in self._entries
+        self._entries[interaction_id] = (time.time() + self._ttl, body, b"")
+
+        if added:
+            self.__added(interaction_id)
+
+    def __release(self, interaction_id: str) -> None:
+        if self._entries.pop(interaction_id, None) is not None:
+            # Releases are rare, a claim adds the id back.
+            try:
+                self._order.remove(interaction_id)
+            except ValueError:
+                pass
+
+    async def claim(self, interaction_id: str) -> Optional[bytes]:
+        return await self.__run(self.__claim, interaction_id)
+
+    async def store(self, interaction_id: str, body: bytes) -> None:
+        await self.__run(self.__store, interaction_id, body)
+
+    async def release(self, interaction_id: str) -> None:
+        await self.__run(self.__release, interaction_id)
@@ -0,0 +1,140 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import os
+import json
+import hashlib
+
+from typing import List, Optional, Set
+
+from ._settings import Command
+from ._models import CommandModel
+from ._cache import fingerprint
+
+
+class DeployResult:
+    def __init__(self, guild_id: str,
+                 commands: Optional[List[CommandModel]] = None,
+                 error: Optional[Exception] = None) -> None:
+        """Used to report deploying commands to one guild.
+
+        Parameters
+        ----------
+        guild_id : str
+        commands : Optional[List[CommandModel]], optional
+            Commands now in guild, None if failed.
+        error : Optional[Exception], optional
+            Raised deploying to guild, None if deployed.
+        """
+
+        self.guild_id = guild_id
+        self.commands = commands
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class DeployState:
+    def __init__(self, path: Optional[str] = None,
+                 save_every: int = 25) -> None:
+        """Used to remember which guilds a deploy has finished,
+           so a partly failed deploy can be resumed.
+
+        Parameters
+        ----------
+        path : Optional[str], optional
+            File to store state in, None to only keep it
+            in memory, by default None
+        save_every : int, optional
+            Finished guilds between writes to disk, so a killed
+            deploy keeps most of its progress, by default 25
+
+        Notes
+        -----
+        Deploying a different set of commands starts over.
+        """
+
+        self._path = path
+        self._save_every = save_every
+        self._unsaved = 0
+
+        self._fingerprint: Optional[str] = None
+        self._completed: Set[str] = set()
+
+        if path and os.path.isfile(path):
+            try:
+                with open(path) as f:
+                    state = json.load(f)
+
+                self._fingerprint = state["fingerprint"]
+                self._completed = set(state["completed"])
+            except (OSError, ValueError, KeyError):
+                self._fingerprint = None
+                self._completed = set()
+
+    def begin(self, commands: List[Command]) -> None:
+        """Used to start deploying commands, forgetting
+           finished guilds if commands have changed.
+
+        Parameters
+        ----------
+        commands : List[Command]
+        """
+
+        current = hashlib.sha256(
+            "".join(fingerprint(command) for command in commands).encode()
+        ).hexdigest()
+
+        if current != self._fingerprint:
+            self._fingerprint = current
+            self._completed = set()
+
+    def completed(self, guild_id: str) -> bool:
+        return guild_id in self._completed
+
+    def complete(self, guild_id: str) -> None:
+        self._completed.add(guild_id)
+
+        self._unsaved += 1
+        if self._unsaved >= self._save_every:
+            self.save()
+
+    def save(self) -> None:
+        """Used to write state to disk, if a path was given.
+        """
+
+        self._unsaved = 0
+
+        if not self._path:
+            return
+
+        temp_path = self._path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump({
+                "fingerprint": self._fingerprint,
+                "completed": sorted(self._completed)
+            }, f)
+
+        os.replace(temp_path, self._path)
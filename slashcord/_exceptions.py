@@ -58,7 +58,32 @@ class HttpException(SlashCordException):
     """Raised when HTTP exception.
     """
 
-    pass
+    def __init__(self, status: int = None) -> None:
+        super().__init__(status)
+
+        self.status = status
+
+
+class RateLimited(HttpException):
+    """Raised when Discord responds with a 429.
+    """
+
+    def __init__(self, retry_after: float, is_global: bool = False) -> None:
+        super().__init__(429)
+
+        self.retry_after = retry_after
+        self.is_global = is_global
+
+
+class OutboundQueueFull(SlashCordException):
+    """Raised when too many requests of a priority are
+       waiting to be sent.
+    """
+
+    def __init__(self, priority: int) -> None:
+        super().__init__(priority)
+
+        self.priority = priority
 
 
 class CommandConfigException(SlashCordException):
@@ -87,3 +112,32 @@ class InvalidDescription(CommandConfigException):
     """
 
     pass
+
+
+class TooManyOptions(CommandConfigException):
+    """Raised when a command or sub command has more than 25 options.
+    """
+
+    pass
+
+
+class TooManyChoices(CommandConfigException):
+    """Raised when an option has more than 25 choices.
+    """
+
+    pass
+
+
+class MissingOptionType(CommandConfigException):
+    """Raised when an option's type hasn't been set.
+    """
+
+    pass
+
+
+class CommandTooLong(CommandConfigException):
+    """Raised when a command's names, descriptions & choices
+       are over 4000 characters combined.
+    """
+
+    pass
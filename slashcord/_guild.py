@@ -21,9 +21,9 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from functools import wraps
+from typing import AsyncGenerator, List
 
-from ._settings import Command
+from ._settings import Command, encode_commands
 from ._models import CommandModel
 
 
@@ -32,41 +32,53 @@ class Guild:
         self._upper = upper
         self.guild_id = guild_id
 
-    def listener(self, command: Command):
+    def listener(self, command: Command, path: str = ""):
         """Used to listen to command.
 
         Parameters
         ----------
         command : Command
+        path : str, optional
+            Used to only listen to a sub command,
+            e.g. 'group sub_command', by default ""
 
         Notes
         -----
         Webhook server must be enabled.
+
+        Listeners must be declared before startup is called,
+        every command in a scope is registered with one request.
         """
 
-        assert self._server
+        assert self._upper._server
 
         def decorator(func):
-            @wraps(func)
-            async def _add_listener(*args, **kwargs):
-                # Keep it simple and just overwrite the command
-                # every time the script is started.
-                command_id = (await self.create_command(command)).id
+            self._upper._registry.add(
+                command, func, self.guild_id, tuple(path.split())
+            )
 
-                if self.guild_id not in self._upper._guild_funcs:
-                    self._upper._guild_funcs[self.guild_id] = {}
+            return func
 
-                if (command_id not in
-                        self._upper._guild_funcs[self.guild_id]):
-                    self._upper._guild_funcs[self.guild_id][command_id] = []
+        return decorator
 
-                self._upper._guild_funcs[self.guild_id][command_id].append(
-                    func
-                )
+    @property
+    def _pathway(self) -> str:
+        return "applications/{}/guilds/{}/commands".format(
+            self._upper._client_id, self.guild_id
+        )
 
-            return _add_listener
+    async def commands(self) -> AsyncGenerator[CommandModel, None]:
+        """Used to list guild commands.
 
-        return decorator
+        Yields
+        -------
+        CommandModel
+        """
+
+        data = await self._upper._get(self._pathway)
+
+        for command in data:
+            yield CommandModel(**command)
 
     async def create_command(self, command: Command) -> CommandModel:
         """Used to create guild command.
@@ -83,10 +95,60 @@ class Guild:
         return CommandModel(
             **(
                 await self._upper._post(
-                    "applications/{}/guilds/{}/commands".format(
-                        self._upper._client_id, self.guild_id
-                    ),
-                    payload=command._payload
+                    self._pathway, payload=command.freeze()._json
                 )
             )
         )
+
+    async def bulk_overwrite_commands(self, commands: List[Command]
+                                      ) -> List[CommandModel]:
+        """Used to overwrite all guild commands with one request.
+
+        Parameters
+        ----------
+        commands : List[Command]
+
+        Returns
+        -------
+        List[CommandModel]
+        """
+
+        return [
+            CommandModel(**command) for command in await self._upper._put(
+                self._pathway,
+                payload=encode_commands(commands)
+            )
+        ]
+
+    async def edit_command(self, command_id: str,
+                           command: Command) -> CommandModel:
+        """Used to edit guild command.
+
+        Parameters
+        ----------
+        command_id : str
+        command : Command
+
+        Returns
+        -------
+        CommandModel
+        """
+
+        return CommandModel(
+            **(
+                await self._upper._patch(
+                    "{}/{}".format(self._pathway, command_id),
+                    payload=command.freeze()._json
+                )
+            )
+        )
+
+    async def delete_command(self, command_id: str) -> None:
+        """Used to delete guild command.
+
+        Parameters
+        ----------
+        command_id : str
+        """
+
+        await self._upper._delete("{}/{}".format(self._pathway, command_id))
@@ -0,0 +1,136 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from ._models import WebhookModel
+
+
+# Interaction being handled, so requests to Discord's API made while
+# handling it can be traced back to it. None outside of interactions.
+CURRENT_WEBHOOK: ContextVar = ContextVar("slashcord_webhook", default=None)
+
+
+class Hook:
+    """Used to trace or profile SlashCord, override the methods needed
+       & pass to SlashCord.add_hook.
+
+    Notes
+    -----
+    Whatever a start method returns is passed to its end method as
+    context, e.g. a tracing span.
+
+    Hooks are called on the event loop, so should be quick & not raise.
+    Nothing is called if no hooks are added.
+    """
+
+    def request_start(self, request: Any) -> Any:
+        """Used to handle a webhook request starting.
+
+        Parameters
+        ----------
+        request : aiohttp.web.BaseRequest
+        """
+
+        return None
+
+    def request_end(self, context: Any, request: Any,
+                    webhook: Optional[WebhookModel], status: int,
+                    duration: float) -> None:
+        """Used to handle a webhook request ending.
+
+        Parameters
+        ----------
+        context : Any
+            Returned by request_start.
+        request : aiohttp.web.BaseRequest
+        webhook : Optional[WebhookModel]
+            None if the request was rejected before decoding.
+        status : int
+            Status code responded with, 500 if handling raised.
+        duration : float
+            Seconds taken.
+        """
+
+    def listener_start(self, webhook: WebhookModel, func: Callable) -> Any:
+        """Used to handle a listener starting.
+
+        Parameters
+        ----------
+        webhook : WebhookModel
+        func : Callable
+        """
+
+        return None
+
+    def listener_end(self, context: Any, webhook: WebhookModel,
+                     func: Callable, duration: float,
+                     error: Optional[Exception]) -> None:
+        """Used to handle a listener ending.
+
+        Parameters
+        ----------
+        context : Any
+            Returned by listener_start.
+        webhook : WebhookModel
+        func : Callable
+        duration : float
+            Seconds taken.
+        error : Optional[Exception]
+            Raised by the listener, including asyncio.TimeoutError.
+        """
+
+    def outbound_start(self, method: str, route: str,
+                       webhook: Optional[WebhookModel]) -> Any:
+        """Used to handle a request to Discord's API starting.
+
+        Parameters
+        ----------
+        method : str
+        route : str
+            Rate limit route, e.g. "POST webhooks/{webhooks}/{token}"
+        webhook : Optional[WebhookModel]
+            Interaction the request was made while handling,
+            None for management calls, e.g. registering commands.
+        """
+
+        return None
+
+    def outbound_end(self, context: Any, method: str, route: str,
+                     webhook: Optional[WebhookModel],
+                     status: Optional[int], duration: float) -> None:
+        """Used to handle a request to Discord's API ending.
+
+        Parameters
+        ----------
+        context : Any
+            Returned by outbound_start.
+        method : str
+        route : str
+        webhook : Optional[WebhookModel]
+        status : Optional[int]
+            None if no response was received.
+        duration : float
+            Seconds taken.
+        """
@@ -0,0 +1,108 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import json
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class JsonCodec(ABC):
+    """Used to encode & decode JSON, subclass to use another backend.
+    """
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Used to decode JSON.
+
+        Parameters
+        ----------
+        data : bytes
+
+        Returns
+        -------
+        Any
+
+        Raises
+        ------
+        ValueError
+            Raised when JSON is invalid.
+        """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Used to encode JSON.
+
+        Parameters
+        ----------
+        obj : Any
+
+        Returns
+        -------
+        bytes
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec using the json module.
+    """
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec using orjson, pip install orjson.
+    """
+
+    def __init__(self) -> None:
+        assert orjson, "orjson isn't installed"
+
+        # Skips a call through the methods below.
+        self.loads = orjson.loads
+        self.dumps = orjson.dumps
+
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+def default_codec() -> JsonCodec:
+    """Used to get the fastest installed codec.
+
+    Returns
+    -------
+    JsonCodec
+    """
+
+    return OrjsonCodec() if orjson else StdlibJsonCodec()
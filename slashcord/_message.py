@@ -23,6 +23,16 @@ SOFTWARE.
 
 from __future__ import annotations
 from datetime import datetime
+from typing import Optional
+
+
+# Interaction response types
+PONG = 1
+CHANNEL_MESSAGE_WITH_SOURCE = 4
+DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE = 5
+
+# Message flags
+EPHEMERAL = 1 << 6
 
 
 class Embed:
@@ -66,7 +76,8 @@ class Embed:
             "title": self.title,
             "description": self.description,
             "url": self.url,
-            "timestamp": self.timestamp.timestamp(),
+            "timestamp": self.timestamp.isoformat()
+            if self.timestamp else None,
             "color": self.color,
             "footer": self._footer,
             "image": self._image,
@@ -263,7 +274,8 @@ class Embed:
 
 class Message:
     def __init__(self, content: str = None, username: str = None,
-                 avatar_url: str = None, tts: bool = False) -> None:
+                 avatar_url: str = None, tts: bool = False,
+                 ephemeral: bool = False) -> None:
         """Used to format a message.
 
         Parameters
@@ -276,12 +288,16 @@ class Message:
             by default None
         tts : bool, optional
             by default False
+        ephemeral : bool, optional
+            Only show interaction response to the user
+            who called the command, by default False
         """
 
         self.content = content
         self.username = username
         self.avatar_url = avatar_url
         self.tts = tts
+        self.ephemeral = ephemeral
 
         self._embeds = []
         self._files = []
@@ -297,6 +313,21 @@ class Message:
             "files": self._files
         }
 
+    @property
+    def _interaction_payload(self) -> dict:
+        payload = {
+            "tts": self.tts,
+            "embeds": self._embeds
+        }
+
+        if self.content is not None:
+            payload["content"] = self.content
+
+        if self.ephemeral:
+            payload["flags"] = EPHEMERAL
+
+        return payload
+
     def add_file(self, file: str, filename: str) -> Message:
         """Used to add file.
 
@@ -342,3 +373,31 @@ class Message:
 
         self._embeds.pop(index)
         return self
+
+
+class Response:
+    def __init__(self, type: int = CHANNEL_MESSAGE_WITH_SOURCE,
+                 message: Optional[Message] = None) -> None:
+        """Used to respond to an interaction, listeners can
+           return a Response or a Message.
+
+        Parameters
+        ----------
+        type : int, optional
+            Interaction response type,
+            by default CHANNEL_MESSAGE_WITH_SOURCE
+        message : Optional[Message], optional
+            by default None
+        """
+
+        self.type = type
+        self.message = message
+
+    @property
+    def _payload(self) -> dict:
+        payload = {"type": self.type}
+
+        if self.message:
+            payload["data"] = self.message._interaction_payload
+
+        return payload
@@ -0,0 +1,202 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+
+# Seconds, from fast in-process stages to slow REST calls.
+DEFAULT_BUCKETS = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...],
+            extra: str = "") -> str:
+    pairs = [
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\")
+                         .replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in zip(names, values)
+    ]
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str,
+                 labels: Tuple[str, ...] = ()) -> None:
+        """Used to count events.
+
+        Parameters
+        ----------
+        name : str
+            Should end with _total.
+        help : str
+        labels : Tuple[str, ...], optional
+            Label names, by default ()
+        """
+
+        self._name = name
+        self._help = help
+        self._labels = labels
+
+        # {
+        #   (label values): int,
+        # }
+        self._values: Dict[Tuple[str, ...], int] = {}
+
+    def inc(self, *labels: str) -> None:
+        self._values[labels] = self._values.get(labels, 0) + 1
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP {} {}".format(self._name, self._help),
+            "# TYPE {} counter".format(self._name)
+        ]
+
+        for labels, value in self._values.items():
+            lines.append("{}{} {}".format(
+                self._name, _labels(self._labels, labels), value
+            ))
+
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Used to record the distribution of durations.
+
+        Parameters
+        ----------
+        name : str
+        help : str
+        labels : Tuple[str, ...], optional
+            Label names, by default ()
+        buckets : Tuple[float, ...], optional
+            Upper bounds in seconds, by default DEFAULT_BUCKETS
+        """
+
+        self._name = name
+        self._help = help
+        self._labels = labels
+        self._buckets = buckets
+
+        # {
+        #   (label values): [[count per bucket, +Inf last], sum],
+        # }
+        self._values: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._values.get(labels)
+        if series is None:
+            series = [[0] * (len(self._buckets) + 1), 0.0]
+            self._values[labels] = series
+
+        series[0][bisect_left(self._buckets, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = [
+            "# HELP {} {}".format(self._name, self._help),
+            "# TYPE {} histogram".format(self._name)
+        ]
+
+        bounds = [repr(bucket) for bucket in self._buckets] + ["+Inf"]
+
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                lines.append("{}_bucket{} {}".format(
+                    self._name,
+                    _labels(self._labels, labels, 'le="{}"'.format(bound)),
+                    cumulative
+                ))
+
+            label_text = _labels(self._labels, labels)
+            lines.append("{}_sum{} {}".format(
+                self._name, label_text, total
+            ))
+            lines.append("{}_count{} {}".format(
+                self._name, label_text, cumulative
+            ))
+
+        return lines
+
+
+class Metrics:
+    def __init__(self) -> None:
+        """Used to record where time goes handling interactions
+           & calling Discord's API.
+
+        Notes
+        -----
+        Metrics are per process, each worker of
+        SlashCord.run_workers records its own.
+        """
+
+        self.webhook_stages = Histogram(
+            "slashcord_webhook_stage_seconds",
+            "Time spent in each stage of handling an interaction.",
+            ("stage",)
+        )
+        self.webhook_responses = Counter(
+            "slashcord_webhook_responses_total",
+            "Webhook responses sent by status code.",
+            ("status",)
+        )
+        self.listener_durations = Histogram(
+            "slashcord_listener_seconds",
+            "Time listeners ran for by command, including deferred ones.",
+            ("command",)
+        )
+        self.rest_requests = Histogram(
+            "slashcord_rest_request_seconds",
+            "Latency of requests to Discord's API by route.",
+            ("route",)
+        )
+        self.rest_responses = Counter(
+            "slashcord_rest_responses_total",
+            "Responses from Discord's API by route & status code.",
+            ("route", "status")
+        )
+
+    def render(self) -> bytes:
+        """Used to render metrics in Prometheus' text format.
+
+        Returns
+        -------
+        bytes
+        """
+
+        lines = []
+        for metric in (self.webhook_stages, self.webhook_responses,
+                       self.listener_durations, self.rest_requests,
+                       self.rest_responses):
+            lines.extend(metric.render())
+
+        return ("\n".join(lines) + "\n").encode()
@@ -21,99 +21,220 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
-TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S%Z"
+# Interaction types
+PING = 1
+APPLICATION_COMMAND = 2
+
+# Fields every interaction has.
+REQUIRED_FIELDS = frozenset(("type", "token", "id"))
+
+
+# Marks lazy attributes not yet built, as None can be a value.
+_MISSING = object()
 
 
 class Option:
-    name: str
-    value: str
+    __slots__ = ("_raw", "_options")
 
-    def __init__(self, name: str, value: str) -> None:
-        self.name = name
-        self.value = value
+    def __init__(self, raw: Dict[str, Any] = None, **kwargs) -> None:
+        self._raw = kwargs if raw is None else raw
+        self._options = None
+
+    @property
+    def name(self) -> str:
+        return self._raw["name"]
+
+    @property
+    def type(self) -> int:
+        return self._raw.get("type")
+
+    @property
+    def value(self) -> Any:
+        return self._raw.get("value")
+
+    @property
+    def options(self) -> List["Option"]:
+        if self._options is None:
+            self._options = [
+                Option(option) for option in self._raw.get("options", ())
+            ]
+
+        return self._options
 
 
 class Data:
-    options: List[Option]
-    name: str
-    id: str
+    __slots__ = ("_raw", "_options")
 
-    def __init__(self, options: List[str], name: str, id: str) -> None:
-        self.options = [Option(option) for option in options]
-        self.name = name
-        self.id = id
+    def __init__(self, raw: Dict[str, Any] = None, **kwargs) -> None:
+        self._raw = kwargs if raw is None else raw
+        self._options = None
+
+    @property
+    def id(self) -> str:
+        return self._raw["id"]
+
+    @property
+    def name(self) -> str:
+        return self._raw["name"]
+
+    @property
+    def options(self) -> List[Option]:
+        if self._options is None:
+            self._options = [
+                Option(option) for option in self._raw.get("options", ())
+            ]
+
+        return self._options
 
 
 class User:
-    id: int
-    username: str
-    avatar: str
-    discriminator: int
-    public_flags: int
-
-    def __init__(self, id: int, username: str, avatar: str, discriminator: int,
-                 public_flags: int) -> None:
-        self.id = id
-        self.username = username
-        self.avatar = avatar
-        self.discriminator = discriminator
-        self.public_flags = public_flags
+    __slots__ = ("_raw",)
+
+    def __init__(self, raw: Dict[str, Any] = None, **kwargs) -> None:
+        self._raw = kwargs if raw is None else raw
+
+    @property
+    def id(self) -> str:
+        return self._raw["id"]
+
+    @property
+    def username(self) -> str:
+        return self._raw["username"]
+
+    @property
+    def avatar(self) -> Optional[str]:
+        return self._raw.get("avatar")
+
+    @property
+    def discriminator(self) -> str:
+        return self._raw["discriminator"]
+
+    @property
+    def public_flags(self) -> int:
+        return self._raw.get("public_flags", 0)
 
 
 class Member:
-    user: User
-    roles: List[str]
-    premium_since: datetime
-    permissions: int
-    pending: bool
-    nick: str
-    mute: bool
-    joined_at: datetime
-    is_pending: bool
-    deaf: bool
-
-    def __init__(self, user: User, roles: List[str], premium_since: str,
-                 permissions: int, pending: bool,
-                 nick: str, mute: bool, joined_at: str,
-                 is_pending: bool, deaf: bool) -> None:
-
-        self.user = user
-        self.roles = roles
-        self.premium_since = datetime.strptime(
-            premium_since, TIMESTAMP_FORMAT
-        ) if premium_since else None
-        self.permissions = permissions
-        self.pending = pending
-        self.nick = nick
-        self.mute = mute
-        self.joined_at = datetime.strptime(joined_at, TIMESTAMP_FORMAT)
-        self.is_pending = is_pending
-        self.deaf = deaf
+    __slots__ = ("_raw", "_user", "_joined_at", "_premium_since")
+
+    def __init__(self, raw: Dict[str, Any] = None, **kwargs) -> None:
+        self._raw = kwargs if raw is None else raw
+
+        self._user = None
+        self._joined_at = None
+        self._premium_since = _MISSING
+
+    @property
+    def user(self) -> User:
+        if self._user is None:
+            self._user = User(self._raw["user"])
+
+        return self._user
+
+    @property
+    def roles(self) -> List[str]:
+        return self._raw["roles"]
+
+    @property
+    def joined_at(self) -> datetime:
+        if self._joined_at is None:
+            self._joined_at = datetime.fromisoformat(self._raw["joined_at"])
+
+        return self._joined_at
+
+    @property
+    def premium_since(self) -> Optional[datetime]:
+        if self._premium_since is _MISSING:
+            premium_since = self._raw.get("premium_since")
+
+            self._premium_since = datetime.fromisoformat(
+                premium_since
+            ) if premium_since else None
+
+        return self._premium_since
+
+    @property
+    def permissions(self) -> Optional[str]:
+        return self._raw.get("permissions")
+
+    @property
+    def pending(self) -> bool:
+        return self._raw.get("pending", False)
+
+    @property
+    def nick(self) -> Optional[str]:
+        return self._raw.get("nick")
+
+    @property
+    def mute(self) -> bool:
+        return self._raw["mute"]
+
+    @property
+    def deaf(self) -> bool:
+        return self._raw["deaf"]
+
+    @property
+    def is_pending(self) -> bool:
+        return self._raw.get("is_pending", False)
 
 
 class WebhookModel:
-    type: int
-    token: str
-    member: Member
-    id: str
-    guild_id: str
-    data: Data
-    channel_id: str
+    __slots__ = ("_raw", "_member", "_data")
 
-    def __init__(self, type: int, token: str, member: Dict[str, Any], id: str,
-                 guild_id: str, data: Data, channel_id: str) -> None:
+    def __init__(self, raw: Dict[str, Any] = None, **kwargs) -> None:
+        """Used to wrap an interaction, nested models are
+           only built when first accessed.
 
-        self.type = type
-        self.token = token
-        self.member = Member(member)
-        self.id = id
-        self.guild_id = guild_id
-        self.data = data
-        self.channel_id = channel_id
+        Parameters
+        ----------
+        raw : Dict[str, Any], optional
+            Decoded interaction, kwargs are used if not passed.
+        """
+
+        self._raw = kwargs if raw is None else raw
+
+        self._member = _MISSING
+        self._data = _MISSING
+
+    @property
+    def type(self) -> int:
+        return self._raw["type"]
+
+    @property
+    def token(self) -> str:
+        return self._raw["token"]
+
+    @property
+    def id(self) -> str:
+        return self._raw["id"]
+
+    @property
+    def guild_id(self) -> Optional[str]:
+        return self._raw.get("guild_id")
+
+    @property
+    def channel_id(self) -> Optional[str]:
+        return self._raw.get("channel_id")
+
+    @property
+    def member(self) -> Optional[Member]:
+        if self._member is _MISSING:
+            member = self._raw.get("member")
+            self._member = Member(member) if member else None
+
+        return self._member
+
+    @property
+    def data(self) -> Optional[Data]:
+        if self._data is _MISSING:
+            data = self._raw.get("data")
+            self._data = Data(data) if data else None
+
+        return self._data
 
 
 class CommandModel:
@@ -122,11 +243,15 @@ class CommandModel:
     name: str
     description: str
     version: str
+    options: List[Dict[str, Any]]
 
     def __init__(self, id: str, application_id: str, name: str,
-                 description: str, version: str, *args, **kwargs) -> None:
+                 description: str, version: str,
+                 options: List[Dict[str, Any]] = None,
+                 *args, **kwargs) -> None:
         self.id = id
         self.application_id = application_id
         self.name = name
         self.description = description
         self.version = version
+        self.options = options or []
@@ -0,0 +1,181 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ._settings import Command
+from ._models import CommandModel
+
+
+def _normalize(value: Any) -> Any:
+    """Used to drop defaulted fields Discord leaves out of responses.
+    """
+
+    if isinstance(value, Mapping):
+        return {
+            key: _normalize(item) for key, item in value.items()
+            if item is not None and item is not False
+            and item != [] and item != ()
+        }
+
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+
+    return value
+
+
+def _scope_key(guild_id: Any) -> Optional[str]:
+    # Guild ids may be given as ints or strings, Discord uses strings.
+    return None if guild_id is None else str(guild_id)
+
+
+def command_changed(model: CommandModel, command: Command) -> bool:
+    """Used to check if a registered command differs from its declaration.
+
+    Parameters
+    ----------
+    model : CommandModel
+        Command registered with Discord.
+    command : Command
+        Command declared locally.
+
+    Returns
+    -------
+    bool
+    """
+
+    return _normalize({
+        "name": model.name,
+        "description": model.description,
+        "options": model.options
+    }) != _normalize(command._payload)
+
+
+class SyncReport:
+    def __init__(self) -> None:
+        """Used to report what sync_commands changed,
+           each item being (guild_id or None, command_name).
+        """
+
+        self.created: List[Tuple[Optional[str], str]] = []
+        self.updated: List[Tuple[Optional[str], str]] = []
+        self.deleted: List[Tuple[Optional[str], str]] = []
+        self.unchanged: List[Tuple[Optional[str], str]] = []
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.created or self.updated or self.deleted)
+
+
+class CommandRegistry:
+    def __init__(self) -> None:
+        """Used to collect decorated commands, so each scope
+           can be synced with one request at startup.
+        """
+
+        # {
+        #   "guild_id" or None: {
+        #       "command_name": (Command, {
+        #           ("sub_command_group", "sub_command"): List[Callable],
+        #       }),
+        #   }
+        # }
+        self._scopes: Dict[
+            Optional[str],
+            Dict[str, Tuple[Command, Dict[Tuple[str, ...], List[Callable]]]]
+        ] = {}
+
+    def add(self, command: Command, func: Callable,
+            guild_id: Optional[str] = None,
+            path: Tuple[str, ...] = ()) -> None:
+        """Used to add listener for command.
+
+        Parameters
+        ----------
+        command : Command
+        func : Callable
+        guild_id : Optional[str], optional
+            None for global commands, by default None
+        path : Tuple[str, ...], optional
+            Sub command group & sub command names, by default ()
+        """
+
+        guild_id = _scope_key(guild_id)
+
+        if guild_id not in self._scopes:
+            self._scopes[guild_id] = {}
+
+        scope = self._scopes[guild_id]
+
+        if command._name not in scope:
+            scope[command._name] = (command, {})
+
+        scope[command._name][1].setdefault(path, []).append(func)
+
+    def scopes(self) -> List[Optional[str]]:
+        """Used to list scopes with commands.
+
+        Returns
+        -------
+        List[Optional[str]]
+            Guild ids, None being global.
+        """
+
+        return list(self._scopes.keys())
+
+    def commands(self, guild_id: Optional[str] = None) -> List[Command]:
+        """Used to list commands of scope.
+
+        Parameters
+        ----------
+        guild_id : Optional[str], optional
+            by default None
+
+        Returns
+        -------
+        List[Command]
+        """
+
+        return [
+            command for command, _ in
+            self._scopes.get(_scope_key(guild_id), {}).values()
+        ]
+
+    def listeners(self, name: str, guild_id: Optional[str] = None
+                  ) -> Dict[Tuple[str, ...], List[Callable]]:
+        """Used to get listeners of command.
+
+        Parameters
+        ----------
+        name : str
+            Command name.
+        guild_id : Optional[str], optional
+            by default None
+
+        Returns
+        -------
+        Dict[Tuple[str, ...], List[Callable]]
+            Sub command path to listeners.
+        """
+
+        return self._scopes[_scope_key(guild_id)][name][1]
@@ -0,0 +1,131 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ._models import WebhookModel
+from ._settings import SUB_COMMAND, SUB_COMMAND_GROUP
+
+
+class RouteNode:
+    def __init__(self) -> None:
+        """Used to hold listeners of a command or sub command.
+        """
+
+        self.listeners: List[Callable] = []
+
+        # {
+        #   "sub_command_name": RouteNode,
+        # }
+        self.children: Dict[str, RouteNode] = {}
+
+
+class Router:
+    def __init__(self) -> None:
+        """Used to route interactions to listeners, built once
+           command ids are known at startup.
+        """
+
+        # {
+        #   "command_id": RouteNode,
+        # }
+        self._ids: Dict[str, RouteNode] = {}
+
+        # {
+        #   ("guild_id" or None, "command_name"): RouteNode,
+        # }
+        self._names: Dict[Tuple[Optional[str], str], RouteNode] = {}
+
+    def add(self, guild_id: Optional[str], name: str, command_id: str,
+            listeners: Dict[Tuple[str, ...], List[Callable]]) -> None:
+        """Used to add command's listeners.
+
+        Parameters
+        ----------
+        guild_id : Optional[str]
+            None for global commands.
+        name : str
+        command_id : str
+        listeners : Dict[Tuple[str, ...], List[Callable]]
+            Sub command path to listeners, () being the command itself.
+        """
+
+        root = RouteNode()
+
+        for path, funcs in listeners.items():
+            node = root
+            for part in path:
+                node = node.children.setdefault(part, RouteNode())
+
+            node.listeners = list(funcs)
+
+        # Guild ids come as strings from Discord.
+        scope = None if guild_id is None else str(guild_id)
+
+        self._ids[str(command_id)] = root
+        self._names[(scope, name)] = root
+
+    def resolve(self, webhook: WebhookModel) -> List[Callable]:
+        """Used to get listeners of interaction.
+
+        Parameters
+        ----------
+        webhook : WebhookModel
+
+        Returns
+        -------
+        List[Callable]
+            Listeners of the deepest matching sub command,
+            empty if none match.
+        """
+
+        data = webhook.data
+        if data is None:
+            return []
+
+        node = self._ids.get(data.id)
+
+        if node is None:
+            node = self._names.get((webhook.guild_id, data.name))
+
+            if node is None:
+                node = self._names.get((None, data.name))
+
+                if node is None:
+                    return []
+
+        listeners = node.listeners
+        options = data.options
+
+        while (options and options[0].type in
+                (SUB_COMMAND, SUB_COMMAND_GROUP)):
+            node = node.children.get(options[0].name)
+            if node is None:
+                break
+
+            if node.listeners:
+                listeners = node.listeners
+
+            options = options[0].options
+
+        return listeners
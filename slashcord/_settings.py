@@ -24,12 +24,22 @@ SOFTWARE.
 from __future__ import annotations
 
 import re
-from typing import Any, List, Optional
+import json
+import hashlib
 
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
+from aiohttp import ClientSession, BaseConnector
+
+from ._dedup import InteractionCache
 from ._exceptions import (
     InvalidName,
     InvalidDescription,
-    InvalidChoiceName
+    InvalidChoiceName,
+    TooManyOptions,
+    TooManyChoices,
+    MissingOptionType,
+    CommandTooLong
 )
 
 
@@ -43,10 +53,21 @@ USER = 6
 CHANNEL = 7
 ROLE = 8
 
+# Methods safe to repeat if a request may have been processed
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
 # Regexps
 ROOT_NAME_REGEX = r"^[\w-]{3,32}$"
 NAME_REGEX = r"^[\w-]{1,32}$"
 
+ROOT_NAME_PATTERN = re.compile(ROOT_NAME_REGEX)
+NAME_PATTERN = re.compile(NAME_REGEX)
+
+# Limits
+MAX_OPTIONS = 25
+MAX_CHOICES = 25
+MAX_COMMAND_LENGTH = 4000
+
 
 def check_length(value: str, exception: Exception,
                  min_: int = 1, max_: int = 100) -> None:
@@ -122,7 +143,7 @@ class CommandType:
         if choices:
             self._option["choices"] = [choice._name for choice in choices]
 
-        return self
+        return self._upper
 
     def integer(self, choices: Optional[List[CommandChoice]] = None
                 ) -> Command:
@@ -172,6 +193,37 @@ class CommandType:
 
         return self._upper
 
+    def sub_command(self) -> SubCommand:
+        """Used to set sub command type.
+
+        Returns
+        -------
+        SubCommand
+            Options added to it belong to the sub command.
+        """
+
+        return self.__nest(SUB_COMMAND)
+
+    def sub_command_group(self) -> SubCommand:
+        """Used to set sub command group type.
+
+        Returns
+        -------
+        SubCommand
+            Sub commands added to it belong to the group.
+        """
+
+        return self.__nest(SUB_COMMAND_GROUP)
+
+    def __nest(self, type_: int) -> SubCommand:
+        self._option["type"] = type_
+        self._option["options"] = []
+
+        # Sub commands can't be required.
+        self._option.pop("required", None)
+
+        return SubCommand(self._option)
+
 
 class Command:
     def __init__(self, name: str, description: str) -> None:
@@ -190,7 +242,7 @@ class Command:
         InvalidDescription
         """
 
-        if not re.search(ROOT_NAME_REGEX, name):
+        if not ROOT_NAME_PATTERN.search(name):
             raise InvalidName()
 
         check_length(description, InvalidDescription)
@@ -224,7 +276,7 @@ class Command:
         InvalidName
         """
 
-        if not re.search(NAME_REGEX, name):
+        if not NAME_PATTERN.search(name):
             raise InvalidName()
 
         check_length(description, InvalidDescription)
@@ -239,10 +291,158 @@ class Command:
 
         return CommandType(self, self._payload["options"][-1])
 
+    def freeze(self) -> FrozenCommand:
+        """Used to validate the whole command once & get a copy
+           which can't be changed, with its JSON encoded.
+
+        Returns
+        -------
+        FrozenCommand
+
+        Raises
+        ------
+        TooManyOptions
+        TooManyChoices
+        MissingOptionType
+        CommandTooLong
+
+        Notes
+        -----
+        Freeze commands sent to many guilds, so they're only
+        validated & encoded once.
+        """
+
+        length = len(self._payload["name"]) + \
+            len(self._payload["description"]) + \
+            _options_length(self._payload["options"])
+
+        if length > MAX_COMMAND_LENGTH:
+            raise CommandTooLong()
+
+        return FrozenCommand(self._name, self._payload)
+
+
+def _options_length(options: List[dict]) -> int:
+    """Used to validate options, counting characters
+       Discord limits commands by.
+    """
+
+    if len(options) > MAX_OPTIONS:
+        raise TooManyOptions()
+
+    length = 0
+    for option in options:
+        # Set by CommandType, Discord rejects options without one.
+        if "type" not in option:
+            raise MissingOptionType()
+
+        length += len(option["name"]) + len(option["description"])
+
+        choices = option.get("choices", ())
+        if len(choices) > MAX_CHOICES:
+            raise TooManyChoices()
+
+        for choice in choices:
+            if isinstance(choice, dict):
+                length += len(choice["name"]) + len(str(choice["value"]))
+            else:
+                length += len(choice)
+
+        if "options" in option:
+            length += _options_length(option["options"])
+
+    return length
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({
+            key: _freeze(item) for key, item in value.items()
+        })
+
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+
+    return value
+
+
+class FrozenCommand:
+    __slots__ = ("_name", "_payload", "_json", "_hash")
+
+    def __init__(self, name: str, payload: dict) -> None:
+        """Used to hold a validated command which can't be changed,
+           see Command.freeze.
+
+        Parameters
+        ----------
+        name : str
+        payload : dict
+            Copied, so later changes to it aren't seen.
+        """
+
+        encoded = json.dumps(
+            payload, sort_keys=True, separators=(",", ":")
+        ).encode()
+
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_payload", _freeze(payload))
+        object.__setattr__(self, "_json", encoded)
+        object.__setattr__(
+            self, "_hash", hashlib.sha256(encoded).hexdigest()
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Frozen commands can't be changed")
+
+    def freeze(self) -> FrozenCommand:
+        return self
+
+
+def encode_commands(commands: List[Command]) -> bytes:
+    """Used to encode commands as a JSON array, reusing
+       the encoding of frozen commands.
+
+    Parameters
+    ----------
+    commands : List[Command]
+
+    Returns
+    -------
+    bytes
+    """
+
+    return b"[" + b",".join(
+        command.freeze()._json for command in commands
+    ) + b"]"
+
+
+class SubCommand(Command):
+    def __init__(self, option: dict) -> None:
+        """Used to add options to a sub command or group.
+
+        Parameters
+        ----------
+        option : dict
+            Payload of the sub command option.
+        """
+
+        self._name = option["name"]
+        self._payload = option
+
 
 class WebhookServer:
     def __init__(self, ip: str = "localhost",
-                 port: int = 8888) -> None:
+                 port: int = 8888, verify_workers: int = 0,
+                 response_timeout: float = 2.5, limit: int = 100,
+                 pending_limit: int = 10000,
+                 command_limits: Optional[Dict[str, int]] = None,
+                 retry_after: int = 1,
+                 listener_timeout: Optional[float] = 900.0,
+                 max_body_size: int = 1048576,
+                 timestamp_window: Optional[float] = 300.0,
+                 replay_cache: int = 10000,
+                 interaction_cache: Optional[InteractionCache] = None,
+                 metrics_path: Optional[str] = None) -> None:
         """Used to configure webhook server.
 
         Parameters
@@ -250,8 +450,196 @@ class WebhookServer:
         ip : str, optional
             Ip of webhook server by default "localhost"
         port : int, optional
-            Port of webhook server by default 8888
+            Port of webhook server, 0 to pick a free port,
+            by default 8888
+        verify_workers : int, optional
+            Threads to verify signatures in, 0 to verify
+            on the event loop, by default 0
+        response_timeout : float, optional
+            Seconds listeners have to return a response before the
+            interaction is deferred & their response is sent as an
+            edit to the original response, by default 2.5
+        limit : int, optional
+            Listeners to run at once, by default 100
+        pending_limit : int, optional
+            Interactions to queue once limit is reached, past which
+            they're shed with a 503, by default 10000
+        command_limits : Dict[str, int], optional
+            Listeners to run at once per command name, past which
+            interactions for that command are shed, by default None
+        retry_after : int, optional
+            Seconds sent in Retry-After when shedding, by default 1
+        listener_timeout : Optional[float], optional
+            Seconds each listener has to finish, None to not
+            timeout, by default 900.0
+        max_body_size : int, optional
+            Bytes a request body can be, by default 1048576
+        timestamp_window : Optional[float], optional
+            Seconds a request's signature timestamp can be from now,
+            None to not check, by default 300.0
+        replay_cache : int, optional
+            Recent signatures to remember so replayed requests are
+            rejected, unless their interaction still has a cached
+            response, 0 to not remember, by default 10000
+        interaction_cache : Optional[InteractionCache], optional
+            Used to answer redelivered interactions with their first
+            response, by default a MemoryInteractionCache.
+        metrics_path : Optional[str], optional
+            Path to serve Prometheus metrics on with GET, e.g.
+            "/metrics", None to not serve them, by default None
+
+        Notes
+        -----
+        Signature verification releases the GIL, so verify_workers
+        stops large bursts of requests from stalling the event loop.
+
+        Discord fails interactions not responded to within 3 seconds,
+        so response_timeout should leave time for the network.
+
+        Shedding interactions once pending_limit is reached keeps
+        latency predictable during spikes, instead of queuing
+        interactions which would time out anyway.
+
+        Interaction tokens expire after 15 minutes, so listeners
+        can't respond after the default listener_timeout.
+
+        Body size, timestamp, content type & replay checks are made
+        before verifying signatures, so garbage is cheap to reject.
+
+        Use a SharedInteractionCache with SlashCord.run_workers,
+        as redeliveries can reach any worker.
+
+        Metrics are per process, so with SlashCord.run_workers
+        each scrape only sees the worker which answered it.
         """
 
         self._ip = ip
         self._port = port
+        self._verify_workers = verify_workers
+        self._response_timeout = response_timeout
+
+        self._limit = limit
+        self._pending_limit = pending_limit
+        self._command_limits = command_limits or {}
+        self._retry_after = retry_after
+        self._listener_timeout = listener_timeout
+
+        self._max_body_size = max_body_size
+        self._timestamp_window = timestamp_window
+        self._replay_cache = replay_cache
+        self._interaction_cache = interaction_cache
+        self._metrics_path = metrics_path
+
+
+class RetryPolicy:
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5,
+                 max_backoff: float = 30.0,
+                 statuses: Tuple[int, ...] = (500, 502, 503, 504),
+                 methods: Tuple[str, ...] = IDEMPOTENT_METHODS,
+                 rate_limits: bool = True) -> None:
+        """Used to configure retrying failed requests.
+
+        Parameters
+        ----------
+        max_retries : int, optional
+            by default 3
+        backoff : float, optional
+            Base seconds of exponential backoff, by default 0.5
+        max_backoff : float, optional
+            Max seconds between retries, by default 30.0
+        statuses : Tuple[int, ...], optional
+            Statuses to retry, by default (500, 502, 503, 504)
+        methods : Tuple[str, ...], optional
+            Methods safe to retry after a server error or dropped
+            connection, by default IDEMPOTENT_METHODS
+        rate_limits : bool, optional
+            Used to retry any method after Retry-After on a 429,
+            by default True
+
+        Notes
+        -----
+        Failed connections are retried for every method,
+        as the request was never sent.
+        """
+
+        self._max_retries = max_retries
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._statuses = statuses
+        self._methods = methods
+        self._rate_limits = rate_limits
+
+
+class HttpClientConfig:
+    def __init__(self, limit: int = 100, limit_per_host: int = 0,
+                 use_dns_cache: bool = True,
+                 ttl_dns_cache: Optional[int] = 10,
+                 keepalive_timeout: float = 15.0,
+                 timeout: Optional[float] = 30.0,
+                 connect_timeout: Optional[float] = None,
+                 session: Optional[ClientSession] = None,
+                 connector: Optional[BaseConnector] = None,
+                 retry: Optional[RetryPolicy] = RetryPolicy(),
+                 base_url: Optional[str] = None,
+                 concurrency: int = 50, max_queued: int = 1000) -> None:
+        """Used to configure the outbound HTTP client.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Max connections in the pool, 0 for unlimited,
+            by default 100
+        limit_per_host : int, optional
+            Max connections per host, 0 for unlimited, by default 0
+        use_dns_cache : bool, optional
+            by default True
+        ttl_dns_cache : Optional[int], optional
+            Seconds to cache DNS lookups for, None to cache forever,
+            by default 10
+        keepalive_timeout : float, optional
+            Seconds to keep idle connections open for, by default 15.0
+        timeout : Optional[float], optional
+            Total seconds a request can take, by default 30.0
+        connect_timeout : Optional[float], optional
+            Seconds to wait for a connection, by default None
+        session : Optional[ClientSession], optional
+            Existing session to share, pool settings are
+            ignored if given, by default None
+        connector : Optional[BaseConnector], optional
+            Existing connector to share, pool settings are
+            ignored if given, by default None
+        retry : Optional[RetryPolicy], optional
+            Set as None to disable retries, by default RetryPolicy()
+        base_url : Optional[str], optional
+            Used to send requests somewhere other than Discord,
+            e.g. FakeDiscord.base_url, by default None
+        concurrency : int, optional
+            Requests in flight at once, past which they're queued
+            by priority, by default 50
+        max_queued : int, optional
+            Requests of each priority which can be queued, past which
+            OutboundQueueFull is raised, by default 1000
+
+        Notes
+        -----
+        Shared sessions & connectors aren't closed by SlashCord.shutdown.
+
+        Queued interaction responses are sent before follow up messages,
+        which are sent before command management. Requests of the same
+        priority take turns between guilds & interactions, so deploying
+        commands can't starve responses.
+        """
+
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._use_dns_cache = use_dns_cache
+        self._ttl_dns_cache = ttl_dns_cache
+        self._keepalive_timeout = keepalive_timeout
+        self._timeout = timeout
+        self._connect_timeout = connect_timeout
+        self._session = session
+        self._connector = connector
+        self._retry = retry
+        self._base_url = base_url
+        self._concurrency = concurrency
+        self._max_queued = max_queued
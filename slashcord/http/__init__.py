@@ -23,5 +23,11 @@ SOFTWARE.
 
 from ._client import HttpClient
 from ._server import HttpServer
+from ._ratelimit import RateLimiter
+from ._queue import OutboundQueue
+from ._fake import FakeDiscord
+from ._workers import WorkerSupervisor
 
 assert HttpClient, HttpServer
+assert RateLimiter, FakeDiscord
+assert WorkerSupervisor, OutboundQueue
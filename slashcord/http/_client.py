@@ -21,13 +21,27 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
 import logging
+import random
+import time
 
+from typing import Any, List, Tuple
 from functools import wraps
-from aiohttp import ClientSession, ClientResponse
-from json import JSONDecodeError
-
-from .._exceptions import HttpException, StartupNotCalled
+from aiohttp import (
+    ClientSession,
+    ClientResponse,
+    ClientConnectionError,
+    ClientConnectorError
+)
+
+from ._ratelimit import RateLimiter, split_route, parse_retry_after
+from ._queue import OutboundQueue, classify
+from .._exceptions import HttpException, StartupNotCalled, RateLimited
+from .._settings import HttpClientConfig, RetryPolicy
+from .._json import JsonCodec
+from .._metrics import Metrics
+from .._hooks import Hook, CURRENT_WEBHOOK
 
 
 def requests_init_required(func):
@@ -43,34 +57,174 @@ def requests_init_required(func):
 
 class HttpClient:
     BASE_URL: str
+    _auth: str
     _requests: ClientSession
+    _ratelimiter: RateLimiter
+    _http_config: HttpClientConfig
+    _json: JsonCodec
+    _metrics: Metrics
+    _hooks: List[Hook]
+    _queue: OutboundQueue
+
+    async def __handle_resp(self, resp: ClientResponse) -> Any:
+        if resp.status == 204:
+            return None
 
-    async def __handle_resp(self, resp: ClientResponse) -> dict:
         try:
-            json = await resp.json()
-        except JSONDecodeError:
-            raise HttpException()
+            json = self._json.loads(await resp.read())
+        except ValueError:
+            raise HttpException(resp.status)
         else:
             if resp.status in (200, 201):
                 return json
             else:
                 logging.error(json)
-                raise HttpException()
+                raise HttpException(resp.status)
+
+    async def __send(self, method: str, pathway: str, payload: Any,
+                     route: str, major: Tuple[str, ...]) -> Any:
+        await self._ratelimiter.acquire(route, major)
+
+        # Authorization is sent per request so shared
+        # sessions can be used by many clients.
+        headers = {"Authorization": self._auth}
+
+        if payload is not None:
+            # Frozen commands are already encoded.
+            if not isinstance(payload, bytes):
+                payload = self._json.dumps(payload)
+
+            headers["Content-Type"] = "application/json"
+
+        await self._queue.acquire(classify(pathway), major)
+
+        hooks = self._hooks
+        if hooks:
+            webhook = CURRENT_WEBHOOK.get()
+            contexts = [
+                hook.outbound_start(method, route, webhook) for hook in hooks
+            ]
+
+        started = time.perf_counter()
+        status = None
+
+        try:
+            async with self._requests.request(
+                    method, self.BASE_URL + pathway, data=payload,
+                    headers=headers) as resp:
+                status = resp.status
+
+                return await self.__receive(resp, route, major)
+        finally:
+            self._queue.release()
+            duration = time.perf_counter() - started
+
+            self._metrics.rest_requests.observe(duration, route)
+            self._metrics.rest_responses.inc(
+                route, "error" if status is None else status
+            )
+
+            if hooks:
+                for hook, context in zip(hooks, contexts):
+                    hook.outbound_end(
+                        context, method, route, webhook, status, duration
+                    )
+
+    async def __receive(self, resp: ClientResponse, route: str,
+                        major: Tuple[str, ...]) -> Any:
+        self._ratelimiter.update(route, major, resp.headers)
+
+        if resp.status == 429:
+            try:
+                json = self._json.loads(await resp.read())
+            except ValueError:
+                json = None
+
+            retry_after, is_global = parse_retry_after(
+                resp.headers, json
+            )
+            self._ratelimiter.limited(
+                route, major, retry_after, is_global
+            )
+
+            logging.warning(
+                "Rate limited on {}, retry after {}s".format(
+                    route, retry_after
+                )
+            )
+            raise RateLimited(retry_after, is_global)
+
+        return await self.__handle_resp(resp)
 
     @requests_init_required
+    async def _request(self, method: str, pathway: str,
+                       payload: Any = None) -> Any:
+        route, major = split_route(method, pathway)
+        policy = self._http_config._retry
+
+        attempt = 0
+        while True:
+            try:
+                return await self.__send(
+                    method, pathway, payload, route, major
+                )
+            except RateLimited:
+                # Request was never processed, so always safe to repeat,
+                # the rate limiter waits out Retry-After on acquire.
+                if (not policy or not policy._rate_limits
+                        or attempt >= policy._max_retries):
+                    raise
+
+                delay = 0.0
+            except HttpException as error:
+                if (not policy or attempt >= policy._max_retries
+                        or method not in policy._methods
+                        or error.status not in policy._statuses):
+                    raise
+
+                delay = self.__backoff(policy, attempt)
+            except ClientConnectorError:
+                # Connection was never made, so safe for any method.
+                if not policy or attempt >= policy._max_retries:
+                    raise
+
+                delay = self.__backoff(policy, attempt)
+            except (ClientConnectionError, asyncio.TimeoutError):
+                # Request may have been processed before failing.
+                if (not policy or attempt >= policy._max_retries
+                        or method not in policy._methods):
+                    raise
+
+                delay = self.__backoff(policy, attempt)
+
+            attempt += 1
+
+            logging.warning(
+                "Retrying {} in {:.2f}s, attempt {} of {}".format(
+                    route, delay, attempt, policy._max_retries
+                )
+            )
+            await asyncio.sleep(delay)
+
+    def __backoff(self, policy: RetryPolicy, attempt: int) -> float:
+        """Exponential backoff with full jitter.
+        """
+
+        return random.uniform(
+            0, min(policy._max_backoff, policy._backoff * 2 ** attempt)
+        )
+
     async def _post(self, pathway: str, payload: dict = None) -> dict:
-        async with self._requests.post(self.BASE_URL + pathway,
-                                       json=payload) as resp:
-            return await self.__handle_resp(resp)
+        return await self._request("POST", pathway, payload)
 
-    @requests_init_required
     async def _patch(self, pathway: str, payload: dict = None) -> dict:
-        async with self._requests.patch(self.BASE_URL + pathway,
-                                        json=payload) as resp:
-            return await self.__handle_resp(resp)
+        return await self._request("PATCH", pathway, payload)
 
-    @requests_init_required
     async def _get(self, pathway: str, payload: dict = None) -> dict:
-        async with self._requests.get(self.BASE_URL + pathway,
-                                      json=payload) as resp:
-            return await self.__handle_resp(resp)
+        return await self._request("GET", pathway, payload)
+
+    async def _put(self, pathway: str, payload: Any = None) -> Any:
+        return await self._request("PUT", pathway, payload)
+
+    async def _delete(self, pathway: str, payload: dict = None) -> None:
+        return await self._request("DELETE", pathway, payload)
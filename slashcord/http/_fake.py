@@ -0,0 +1,409 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import hashlib
+import itertools
+import random
+
+from typing import Any, Dict, List, Optional, Tuple
+from aiohttp import web
+
+from ._ratelimit import split_route
+from .._json import JsonCodec, default_codec
+
+
+class FakeDiscord:
+    def __init__(self, client_id: int = 0, ip: str = "127.0.0.1",
+                 port: int = 0, latency: float = 0.0,
+                 rate_limit: Optional[int] = None,
+                 rate_limit_window: float = 1.0,
+                 error_rate: float = 0.0,
+                 json_codec: Optional[JsonCodec] = None) -> None:
+        """Used to run an in-process stand in for Discord's
+           application command API, for offline tests & benchmarks.
+
+        Parameters
+        ----------
+        client_id : int, optional
+            by default 0
+        ip : str, optional
+            by default "127.0.0.1"
+        port : int, optional
+            0 to pick a free port, by default 0
+        latency : float, optional
+            Seconds to delay every response by, by default 0.0
+        rate_limit : Optional[int], optional
+            Requests allowed per bucket per window,
+            None to disable, by default None
+        rate_limit_window : float, optional
+            Seconds before buckets reset, by default 1.0
+        error_rate : float, optional
+            Chance of a request failing with a 500, by default 0.0
+        json_codec : Optional[JsonCodec], optional
+            by default default_codec()
+
+        Notes
+        -----
+        Pass self.base_url to HttpClientConfig(base_url=...).
+        """
+
+        self.client_id = str(client_id)
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_limit_window = rate_limit_window
+        self.error_rate = error_rate
+
+        self._ip = ip
+        self._port = port
+        self._json = json_codec or default_codec()
+
+        # Every request received, (method, path).
+        self.requests: List[Tuple[str, str]] = []
+
+        # {
+        #   "guild_id" or None: {
+        #       "command_id": dict,
+        #   }
+        # }
+        self.commands: Dict[Optional[str], Dict[str, dict]] = {}
+
+        # {
+        #   "interaction_token": [dict, ...],
+        # }
+        # First being the original response if edited.
+        self.messages: Dict[str, List[dict]] = {}
+
+        # Statuses to respond with before handling requests normally.
+        self._errors: List[int] = []
+
+        # {
+        #   (route, major): (remaining, reset_at),
+        # }
+        self._buckets: Dict[Tuple[str, tuple], Tuple[int, float]] = {}
+
+        self._ids = itertools.count(int(client_id) + 1)
+
+        app = web.Application(middlewares=[self._middleware])
+
+        scopes = (
+            "/api/v8/applications/{client_id}",
+            "/api/v8/applications/{client_id}/guilds/{guild_id}"
+        )
+        for scope in scopes:
+            app.router.add_get(scope + "/commands", self._list)
+            app.router.add_post(scope + "/commands", self._create)
+            app.router.add_put(scope + "/commands", self._overwrite)
+            app.router.add_get(scope + "/commands/{command_id}", self._get)
+            app.router.add_patch(
+                scope + "/commands/{command_id}", self._edit
+            )
+            app.router.add_delete(
+                scope + "/commands/{command_id}", self._delete
+            )
+
+        webhook = "/api/v8/webhooks/{client_id}/{token}"
+        app.router.add_post(webhook, self._follow_up)
+        app.router.add_patch(
+            webhook + "/messages/@original", self._edit_original
+        )
+        app.router.add_delete(
+            webhook + "/messages/@original", self._delete_original
+        )
+
+        self._runner = web.AppRunner(app)
+
+    @property
+    def base_url(self) -> str:
+        return "http://{}:{}/api/v8/".format(self._ip, self._port)
+
+    async def start(self) -> None:
+        """Used to start server.
+        """
+
+        await self._runner.setup()
+
+        site = web.TCPSite(self._runner, self._ip, self._port)
+        await site.start()
+
+        if not self._port:
+            self._port = site._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Used to stop server.
+        """
+
+        await self._runner.cleanup()
+
+    def inject_error(self, status: int, times: int = 1) -> None:
+        """Used to fail the next requests.
+
+        Parameters
+        ----------
+        status : int
+            e.g. 429, 500 or 503
+        times : int, optional
+            by default 1
+        """
+
+        self._errors += [status] * times
+
+    def __response(self, data: Any = None, status: int = 200,
+                   headers: Optional[dict] = None) -> web.Response:
+        if data is None:
+            return web.Response(status=status, headers=headers)
+
+        return web.Response(
+            body=self._json.dumps(data), status=status,
+            content_type="application/json", headers=headers
+        )
+
+    def __rate_limit(self, request: web.Request) -> Tuple[bool, dict]:
+        """Used to count request against its bucket.
+
+        Returns
+        -------
+        Tuple[bool, dict]
+            If limited & rate limit headers.
+        """
+
+        route, major = split_route(request.method, request.path[8:])
+        loop = asyncio.get_event_loop()
+
+        remaining, reset_at = self._buckets.get(
+            (route, major), (self.rate_limit, 0.0)
+        )
+
+        if reset_at <= loop.time():
+            remaining = self.rate_limit
+            reset_at = loop.time() + self.rate_limit_window
+
+        limited = remaining <= 0
+        if not limited:
+            remaining -= 1
+
+        self._buckets[(route, major)] = (remaining, reset_at)
+
+        return limited, {
+            "X-RateLimit-Bucket": hashlib.md5(route.encode()).hexdigest(),
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(remaining),
+            "X-RateLimit-Reset-After": "{:.3f}".format(
+                reset_at - loop.time()
+            )
+        }
+
+    @web.middleware
+    async def _middleware(self, request: web.Request,
+                          handler) -> web.Response:
+        self.requests.append((request.method, request.path))
+
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        if "Authorization" not in request.headers:
+            return self.__response(
+                {"message": "401: Unauthorized", "code": 0}, 401
+            )
+
+        headers = {}
+        if self.rate_limit is not None:
+            limited, headers = self.__rate_limit(request)
+
+            if limited:
+                retry_after = float(headers["X-RateLimit-Reset-After"])
+
+                return self.__response({
+                    "message": "You are being rate limited.",
+                    "retry_after": retry_after,
+                    "global": False
+                }, 429, dict(headers, **{
+                    "Retry-After": str(int(retry_after) + 1)
+                }))
+
+        if self._errors:
+            status = self._errors.pop(0)
+        elif self.error_rate and random.random() < self.error_rate:
+            status = 500
+        else:
+            status = None
+
+        if status == 429:
+            return self.__response({
+                "message": "You are being rate limited.",
+                "retry_after": 0.0,
+                "global": False
+            }, 429, {"Retry-After": "0"})
+        elif status:
+            return self.__response(
+                {"message": "Injected error", "code": 0}, status, headers
+            )
+
+        client_id = request.match_info.get("client_id", self.client_id)
+        if client_id != self.client_id:
+            return self.__response(
+                {"message": "Unknown Application", "code": 10002}, 404
+            )
+
+        response = await handler(request)
+        response.headers.update(headers)
+
+        return response
+
+    def _scope(self, request: web.Request) -> Dict[str, dict]:
+        return self.commands.setdefault(
+            request.match_info.get("guild_id"), {}
+        )
+
+    def _model(self, request: web.Request, payload: dict,
+               command_id: Optional[str] = None) -> dict:
+        model = dict(payload)
+        model.update({
+            "id": command_id or str(next(self._ids)),
+            "application_id": self.client_id,
+            "version": str(next(self._ids))
+        })
+
+        if request.match_info.get("guild_id"):
+            model["guild_id"] = request.match_info["guild_id"]
+
+        return model
+
+    async def _list(self, request: web.Request) -> web.Response:
+        return self.__response(list(self._scope(request).values()))
+
+    async def _get(self, request: web.Request) -> web.Response:
+        scope = self._scope(request)
+        command_id = request.match_info["command_id"]
+
+        if command_id not in scope:
+            return self.__response(
+                {"message": "Unknown application command", "code": 10063},
+                404
+            )
+
+        return self.__response(scope[command_id])
+
+    async def _create(self, request: web.Request) -> web.Response:
+        scope = self._scope(request)
+        payload = self._json.loads(await request.read())
+
+        # Creating a command with an existing name overwrites it.
+        for command_id, command in scope.items():
+            if command["name"] == payload["name"]:
+                scope[command_id] = self._model(request, payload, command_id)
+                return self.__response(scope[command_id])
+
+        model = self._model(request, payload)
+        scope[model["id"]] = model
+
+        return self.__response(model, 201)
+
+    async def _overwrite(self, request: web.Request) -> web.Response:
+        scope = self._scope(request)
+        existing = {command["name"]: command_id
+                    for command_id, command in scope.items()}
+
+        scope.clear()
+        for payload in self._json.loads(await request.read()):
+            model = self._model(
+                request, payload, existing.get(payload["name"])
+            )
+            scope[model["id"]] = model
+
+        return self.__response(list(scope.values()))
+
+    async def _edit(self, request: web.Request) -> web.Response:
+        scope = self._scope(request)
+        command_id = request.match_info["command_id"]
+
+        if command_id not in scope:
+            return self.__response(
+                {"message": "Unknown application command", "code": 10063},
+                404
+            )
+
+        payload = dict(scope[command_id])
+        payload.update(self._json.loads(await request.read()))
+
+        scope[command_id] = self._model(request, payload, command_id)
+
+        return self.__response(scope[command_id])
+
+    async def _delete(self, request: web.Request) -> web.Response:
+        scope = self._scope(request)
+        command_id = request.match_info["command_id"]
+
+        if command_id not in scope:
+            return self.__response(
+                {"message": "Unknown application command", "code": 10063},
+                404
+            )
+
+        scope.pop(command_id)
+
+        return self.__response(status=204)
+
+    def _message(self, payload: dict) -> dict:
+        message = dict(payload)
+        message.update({
+            "id": str(next(self._ids)),
+            "webhook_id": self.client_id
+        })
+
+        return message
+
+    async def _follow_up(self, request: web.Request) -> web.Response:
+        messages = self.messages.setdefault(request.match_info["token"], [])
+
+        message = self._message(self._json.loads(await request.read()))
+        if not messages:
+            # Original response is a placeholder until edited.
+            messages.append(None)
+
+        messages.append(message)
+
+        return self.__response(message)
+
+    async def _edit_original(self, request: web.Request) -> web.Response:
+        messages = self.messages.setdefault(request.match_info["token"], [])
+
+        message = self._message(self._json.loads(await request.read()))
+        if messages:
+            messages[0] = message
+        else:
+            messages.append(message)
+
+        return self.__response(message)
+
+    async def _delete_original(self, request: web.Request) -> web.Response:
+        messages = self.messages.get(request.match_info["token"])
+
+        if not messages or messages[0] is None:
+            return self.__response(
+                {"message": "Unknown Message", "code": 10008}, 404
+            )
+
+        messages[0] = None
+
+        return self.__response(status=204)
@@ -0,0 +1,155 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+from collections import OrderedDict, deque
+from typing import Deque, Dict, Hashable, List
+
+from .._exceptions import OutboundQueueFull
+
+
+# Priority classes, lower are sent first.
+INTERACTION = 0
+FOLLOW_UP = 1
+MANAGEMENT = 2
+
+
+def classify(pathway: str) -> int:
+    """Used to get the priority class of a request.
+
+    Parameters
+    ----------
+    pathway : str
+
+    Returns
+    -------
+    int
+        INTERACTION for interaction responses & edits to them,
+        FOLLOW_UP for other webhook messages, otherwise MANAGEMENT.
+    """
+
+    if pathway.startswith("interactions/"):
+        return INTERACTION
+
+    if pathway.startswith("webhooks/"):
+        if pathway.endswith("/messages/@original"):
+            return INTERACTION
+
+        return FOLLOW_UP
+
+    return MANAGEMENT
+
+
+class OutboundQueue:
+    def __init__(self, concurrency: int = 50,
+                 max_queued: int = 1000) -> None:
+        """Used to order outbound requests by priority class,
+           sharing each class fairly between keys e.g. guilds.
+
+        Parameters
+        ----------
+        concurrency : int, optional
+            Requests in flight at once, by default 50
+        max_queued : int, optional
+            Requests of each priority class which can wait,
+            by default 1000
+        """
+
+        self._concurrency = concurrency
+        self._max_queued = max_queued
+
+        self._active = 0
+
+        # [
+        #   {
+        #       key: deque([Future, ...]),
+        #   },
+        # ]
+        # One per priority class, keys in round robin order.
+        self._waiting: List[Dict[Hashable, Deque[asyncio.Future]]] = [
+            OrderedDict() for _ in range(MANAGEMENT + 1)
+        ]
+        self._queued = [0] * (MANAGEMENT + 1)
+
+    async def acquire(self, priority: int, key: Hashable) -> None:
+        """Used to wait for a slot to send a request in.
+
+        Parameters
+        ----------
+        priority : int
+        key : Hashable
+            Requests with different keys take turns.
+
+        Raises
+        ------
+        OutboundQueueFull
+        """
+
+        if self._active < self._concurrency and not any(self._queued):
+            self._active += 1
+            return
+
+        if self._queued[priority] >= self._max_queued:
+            raise OutboundQueueFull(priority)
+
+        future = asyncio.get_event_loop().create_future()
+
+        waiting = self._waiting[priority]
+        if key not in waiting:
+            waiting[key] = deque()
+        waiting[key].append(future)
+
+        self._queued[priority] += 1
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled futures are skipped by release, but
+            # a slot handed over while cancelling must be freed.
+            if not future.cancelled():
+                self.release()
+
+            raise
+
+    def release(self) -> None:
+        """Used to hand a finished request's slot to the next waiting.
+        """
+
+        for priority, waiting in enumerate(self._waiting):
+            while waiting:
+                key, futures = next(iter(waiting.items()))
+
+                future = futures.popleft()
+                if futures:
+                    waiting.move_to_end(key)
+                else:
+                    del waiting[key]
+
+                self._queued[priority] -= 1
+
+                if not future.done():
+                    future.set_result(None)
+                    return
+
+        self._active -= 1
@@ -0,0 +1,249 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+
+from typing import Dict, Mapping, Optional, Tuple
+
+
+# Path segments whose following value is a "major parameter",
+# Discord rate limits these routes per value instead of globally.
+MAJOR_PARAMETERS = ("applications", "guilds", "channels", "webhooks")
+
+# Buckets kept before expired ones are pruned, interaction tokens
+# create a bucket for every interaction responded to.
+PRUNE_AFTER = 256
+
+
+def split_route(method: str, pathway: str) -> Tuple[str, Tuple[str, ...]]:
+    """Used to split a pathway into its route & major parameters.
+
+    Parameters
+    ----------
+    method : str
+        HTTP method.
+    pathway : str
+        e.g. 'applications/1234/guilds/5678/commands/9012'
+
+    Returns
+    -------
+    Tuple[str, Tuple[str, ...]]
+        Route, e.g. 'PATCH applications/{applications}/guilds/{guilds}/
+        commands/:id' & major parameters, e.g. ('1234', '5678').
+    """
+
+    segments = pathway.split("/")
+    route = []
+    major = []
+
+    for index, segment in enumerate(segments):
+        previous = segments[index - 1] if index else None
+
+        if previous in MAJOR_PARAMETERS:
+            route.append("{" + previous + "}")
+            major.append(segment)
+        elif index > 1 and segments[index - 2] == "webhooks":
+            # Webhook tokens are limited like a major parameter.
+            route.append("{token}")
+            major.append(segment)
+        elif segment.isdigit():
+            route.append(":id")
+        elif index > 1 and segments[index - 2] == "interactions":
+            route.append(":token")
+        else:
+            route.append(segment)
+
+    return method + " " + "/".join(route), tuple(major)
+
+
+def parse_retry_after(headers: Mapping[str, str],
+                      json: Optional[dict] = None) -> Tuple[float, bool]:
+    """Used to read retry after & global flag from a 429.
+
+    Parameters
+    ----------
+    headers : Mapping[str, str]
+    json : Optional[dict], optional
+        Response body, by default None
+
+    Returns
+    -------
+    Tuple[float, bool]
+    """
+
+    if isinstance(json, dict) and "retry_after" in json:
+        retry_after = float(json["retry_after"])
+        is_global = bool(json.get("global", False))
+    else:
+        retry_after = float(
+            headers.get("Retry-After")
+            or headers.get("X-RateLimit-Reset-After")
+            or 1
+        )
+        is_global = False
+
+    if headers.get("X-RateLimit-Global", "").lower() == "true":
+        is_global = True
+
+    return retry_after, is_global
+
+
+class Bucket:
+    def __init__(self) -> None:
+        """Used to track a single rate limit bucket.
+        """
+
+        self.limit = None
+        self.remaining = None
+        self.reset_at = 0.0
+
+        self.lock = asyncio.Lock()
+
+
+class RateLimiter:
+    def __init__(self) -> None:
+        """Used to wait for rate limits before sending requests,
+           instead of waiting to be rejected by Discord.
+        """
+
+        # {
+        #   "route": "X-RateLimit-Bucket",
+        # }
+        self._routes: Dict[str, str] = {}
+
+        # {
+        #   ("X-RateLimit-Bucket" or "route", major): Bucket,
+        # }
+        self._buckets: Dict[Tuple[str, tuple], Bucket] = {}
+        self._prune_after = PRUNE_AFTER
+
+        self._global_reset = 0.0
+
+    def _bucket(self, route: str, major: Tuple[str, ...]) -> Bucket:
+        key = (self._routes.get(route, route), major)
+
+        if key not in self._buckets:
+            self._buckets[key] = Bucket()
+
+        return self._buckets[key]
+
+    def _prune(self) -> None:
+        """Used to forget buckets which have reset & aren't in use.
+        """
+
+        now = asyncio.get_event_loop().time()
+
+        self._buckets = {
+            key: bucket for key, bucket in self._buckets.items()
+            if bucket.reset_at > now or bucket.lock.locked()
+        }
+
+        # Pruned again once grown past double what's left,
+        # so pruning stays cheap while many buckets are active.
+        self._prune_after = max(PRUNE_AFTER, len(self._buckets) * 2)
+
+    async def acquire(self, route: str, major: Tuple[str, ...]) -> None:
+        """Used to wait until a request can be sent on route.
+
+        Parameters
+        ----------
+        route : str
+        major : Tuple[str, ...]
+        """
+
+        loop = asyncio.get_event_loop()
+
+        delay = self._global_reset - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        bucket = self._bucket(route, major)
+
+        # Lock is held while sleeping, so waiters are released
+        # one at a time in the order they arrived.
+        async with bucket.lock:
+            now = loop.time()
+
+            if bucket.reset_at <= now:
+                bucket.remaining = bucket.limit
+            elif bucket.remaining is not None and bucket.remaining <= 0:
+                await asyncio.sleep(bucket.reset_at - now)
+                bucket.remaining = bucket.limit
+
+            if bucket.remaining is not None:
+                bucket.remaining -= 1
+
+    def update(self, route: str, major: Tuple[str, ...],
+               headers: Mapping[str, str]) -> None:
+        """Used to update bucket from response headers.
+
+        Parameters
+        ----------
+        route : str
+        major : Tuple[str, ...]
+        headers : Mapping[str, str]
+        """
+
+        if "X-RateLimit-Bucket" in headers:
+            self._routes[route] = headers["X-RateLimit-Bucket"]
+
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        bucket = self._bucket(route, major)
+
+        if "X-RateLimit-Limit" in headers:
+            bucket.limit = int(headers["X-RateLimit-Limit"])
+
+        bucket.remaining = int(headers["X-RateLimit-Remaining"])
+
+        if "X-RateLimit-Reset-After" in headers:
+            bucket.reset_at = asyncio.get_event_loop().time() + float(
+                headers["X-RateLimit-Reset-After"]
+            )
+
+        if len(self._buckets) > self._prune_after:
+            self._prune()
+
+    def limited(self, route: str, major: Tuple[str, ...],
+                retry_after: float, is_global: bool = False) -> None:
+        """Used to record a 429 response.
+
+        Parameters
+        ----------
+        route : str
+        major : Tuple[str, ...]
+        retry_after : float
+            Seconds until requests can be sent again.
+        is_global : bool, optional
+            If the whole client is limited, by default False
+        """
+
+        reset_at = asyncio.get_event_loop().time() + retry_after
+
+        if is_global:
+            self._global_reset = max(self._global_reset, reset_at)
+        else:
+            bucket = self._bucket(route, major)
+            bucket.remaining = 0
+            bucket.reset_at = max(bucket.reset_at, reset_at)
@@ -21,61 +21,312 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import asyncio
+import json
+import logging
+import time
+
+from collections import Counter, OrderedDict
 from aiohttp import web
+from typing import Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
 
+from .._dedup import MemoryInteractionCache
+from .._hooks import CURRENT_WEBHOOK
 from .._exceptions import InvalidSignature, InvalidJson
-from .._models import WebhookModel
+from .._models import WebhookModel, PING
+from .._message import (
+    Message,
+    Response,
+    PONG,
+    CHANNEL_MESSAGE_WITH_SOURCE,
+    DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE
+)
+from .._settings import WebhookServer
+
+
+# Bodies of fixed responses, encoded once.
+PONG_BODY = json.dumps({"type": PONG}).encode()
+DEFERRED_BODY = json.dumps(
+    {"type": DEFERRED_CHANNEL_MESSAGE_WITH_SOURCE}
+).encode()
+# Sent for interactions without listeners.
+UNKNOWN_COMMAND_BODY = json.dumps(
+    Response(
+        CHANNEL_MESSAGE_WITH_SOURCE,
+        Message("This command isn't available right now.", ephemeral=True)
+    )._payload
+).encode()
+
+METRICS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 
 class HttpServer:
-    def __init__(self, ip: str, port: int, upper: object) -> None:
+    def __init__(self, config: WebhookServer, upper: object) -> None:
         """Used to create a lightweight HTTP server.
 
         Parameters
         ----------
-        ip : str
-        port : int
+        config : WebhookServer
         upper : object
             SlashCord instance
         """
 
-        self._server = web.Server(self.handler)
-        self._runner = web.ServerRunner(self._server)
+        # Created on start, as aiohttp binds them to the running loop.
+        self._server = None
+        self._runner = None
+        self._site = None
 
-        self._ip = ip
-        self._port = port
+        self._ip = config._ip
+        self._port = config._port
         self._upper = upper
 
-    def __response(data: dict = None, error: str = False,
-                   status_code: int = 200) -> web.json_response:
-        """Used to respond to a request.
+        self._verify_workers = config._verify_workers
+        self._executor = None
+
+        self._response_timeout = config._response_timeout
+        self._listener_timeout = config._listener_timeout
+
+        self._limit = config._limit
+        self._pending_limit = config._pending_limit
+        self._command_limits = config._command_limits
+        self._retry_after = str(config._retry_after)
+        # {
+        #   "command_name": int,
+        # }
+        # Listeners currently running for each limited command.
+        self._running = Counter()
+
+        self._max_body_size = config._max_body_size
+        self._timestamp_window = config._timestamp_window
+        self._replay_cache = config._replay_cache
+        # {
+        #   "signature": "interaction_id" or None,
+        # }
+        # Recently verified signatures, oldest first.
+        self._signatures: OrderedDict = OrderedDict()
+
+        self._metrics_path = config._metrics_path
+
+        self._interactions = (
+            config._interaction_cache or MemoryInteractionCache()
+        )
+
+        # Set by WorkerSupervisor, so workers can share the port.
+        self._reuse_port = False
+
+        # {
+        #   "error": bytes,
+        # }
+        # Encoded error bodies, as errors are fixed strings.
+        self._errors: Dict[str, bytes] = {}
+
+    def __response(self, body: bytes, status_code: int = 200
+                   ) -> web.Response:
+        """Used to respond with an encoded body.
 
         Parameters
         ----------
-        data : dict, optional
-            by default None
-        error : str, optional
-            by default False
+        body : bytes
         status_code : int, optional
             by default 200
 
         Returns
         -------
-        web.json_response
+        web.Response
+
+        Notes
+        -----
+        aiohttp responses can't be sent twice, so only
+        their bodies are reused.
         """
 
-        return web.json_response(
-            {"data": data, "error": error},
-            status=500 if error and status_code == 200 else status_code
+        return web.Response(
+            body=body,
+            status=status_code,
+            content_type="application/json"
         )
 
+    def __error(self, error: str, status_code: int) -> web.Response:
+        body = self._errors.get(error)
+        if body is None:
+            body = self._upper._json.dumps({"error": error})
+            self._errors[error] = body
+
+        return self.__response(body, status_code)
+
+    def __shed(self) -> web.Response:
+        resp = self.__error("Overloaded", 503)
+        resp.headers["Retry-After"] = self._retry_after
+
+        return resp
+
+    async def __read(self, request: web.BaseRequest) -> Optional[bytes]:
+        """Used to read the body, stopping once it's too large.
+
+        Returns
+        -------
+        Optional[bytes]
+            None if the body is larger than max_body_size.
+        """
+
+        if (request.content_length is not None
+                and request.content_length > self._max_body_size):
+            return None
+
+        chunks = []
+        size = 0
+
+        async for chunk in request.content.iter_any():
+            size += len(chunk)
+            if size > self._max_body_size:
+                return None
+
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    def __fresh(self, timestamp: str) -> bool:
+        if self._timestamp_window is None:
+            return True
+
+        try:
+            return abs(time.time() - float(timestamp)) <= \
+                self._timestamp_window
+        except ValueError:
+            return False
+
+    def __remember(self, signature: str,
+                   interaction_id: Optional[str]) -> None:
+        self._signatures[signature] = interaction_id
+
+        if len(self._signatures) > self._replay_cache:
+            self._signatures.popitem(last=False)
+
+    async def __replayed(self, interaction_id: Optional[str]
+                         ) -> web.Response:
+        """Used to answer a request with an already seen signature.
+
+        Parameters
+        ----------
+        interaction_id : Optional[str]
+            Interaction the signature was verified for.
+
+        Returns
+        -------
+        web.Response
+            Cached response for byte identical retries, e.g. from
+            a proxy, otherwise an error.
+        """
+
+        if interaction_id is not None:
+            cached = await self._interactions.claim(interaction_id)
+            if cached is not None:
+                return self.__response(cached or DEFERRED_BODY)
+
+            # No longer cached, so isn't answered again.
+            await self._interactions.release(interaction_id)
+
+        return self.__error("Replayed request", 401)
+
+    def __full(self) -> bool:
+        scheduler = self._upper._scheduler
+
+        # spawn only waits once running & pending jobs are at their limits.
+        return (scheduler.pending_count >= scheduler.pending_limit
+                and scheduler.active_count >= scheduler.limit)
+
+    def __release(self, name: Optional[str]) -> None:
+        if name is not None:
+            self._running[name] -= 1
+
+    async def __listen(self, funcs: List[Callable], webhook: WebhookModel,
+                       inline: asyncio.Future,
+                       limited: Optional[str]) -> None:
+        """Used to call listeners within one scheduler job, editing
+           the original response if the handler already deferred.
+
+        Parameters
+        ----------
+        funcs : List[Callable]
+        webhook : WebhookModel
+        inline : asyncio.Future
+            Resolved with the first response if the handler is still
+            waiting, cancelled by the handler once response_timeout
+            passes.
+        limited : Optional[str]
+            Command name to release the running count of.
+        """
+
+        def respond(result: object) -> None:
+            if not inline.done():
+                inline.set_result(result)
+
+        # Pending jobs are started from another job's context,
+        # so set here for requests listeners make to Discord's API.
+        CURRENT_WEBHOOK.set(webhook)
+
+        try:
+            try:
+                result = await self._upper._call_listeners(
+                    funcs, webhook, respond
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                if not inline.done():
+                    inline.set_exception(error)
+                else:
+                    logging.exception("Listener failed after deferring")
+
+                return
+
+            if not inline.done():
+                inline.set_result(result)
+                return
+
+            if not inline.cancelled():
+                # Already answered inline by respond.
+                return
+
+            if isinstance(result, Response):
+                result = result.message
+
+            if result is not None:
+                await self._upper.edit_original_response(
+                    webhook.token, result
+                )
+        finally:
+            self.__release(limited)
+
     async def start(self) -> None:
         """Used to start lightweight HTTP server.
         """
 
+        if self._verify_workers:
+            self._executor = ThreadPoolExecutor(
+                self._verify_workers, thread_name_prefix="slashcord-verify"
+            )
+
+        self._server = web.Server(self.handler)
+        self._runner = web.ServerRunner(self._server)
+
         await self._runner.setup()
-        site = web.TCPSite(self._runner, self._ip, self._port)
-        await site.start()
+        self._site = web.TCPSite(
+            self._runner, self._ip, self._port,
+            reuse_port=self._reuse_port or None
+        )
+        await self._site.start()
+
+        if not self._port:
+            self._port = self._site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Used to stop accepting connections, requests
+           already accepted are still answered.
+        """
+
+        await self._site.stop()
 
     async def close(self) -> None:
         """Closes lightweight HTTP server.
@@ -83,7 +334,10 @@ class HttpServer:
 
         await self._runner.cleanup()
 
-    async def handler(self, request: web.Request) -> web.json_response:
+        if self._executor:
+            self._executor.shutdown(wait=False)
+
+    async def handler(self, request: web.Request) -> web.Response:
         """Used to handle HTTP request.
 
         Parameters
@@ -92,49 +346,230 @@ class HttpServer:
 
         Returns
         -------
-        web.json_response
+        web.Response
         """
 
+        if (request.method == "GET" and self._metrics_path
+                and request.path == self._metrics_path):
+            return web.Response(
+                body=self._upper._metrics.render(),
+                headers={"Content-Type": METRICS_CONTENT_TYPE}
+            )
+
+        # Set by __handle once decoded, reset as keep-alive
+        # connections handle their requests in the same task.
+        token = CURRENT_WEBHOOK.set(None)
+
+        try:
+            hooks = self._upper._hooks
+            if not hooks:
+                return await self.__counted(request)
+
+            started = time.perf_counter()
+            contexts = [hook.request_start(request) for hook in hooks]
+            status = 500
+
+            try:
+                resp = await self.__counted(request)
+                status = resp.status
+
+                return resp
+            finally:
+                duration = time.perf_counter() - started
+                webhook = CURRENT_WEBHOOK.get()
+                for hook, context in zip(hooks, contexts):
+                    hook.request_end(
+                        context, request, webhook, status, duration
+                    )
+        finally:
+            CURRENT_WEBHOOK.reset(token)
+
+    async def __counted(self, request: web.Request) -> web.Response:
+        responses = self._upper._metrics.webhook_responses
+
+        try:
+            resp = await self.__handle(request)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # aiohttp answers with a 500 once this raises.
+            responses.inc(500)
+            raise
+
+        responses.inc(resp.status)
+
+        return resp
+
+    async def __handle(self, request: web.Request) -> web.Response:
         if request.method != "POST":
-            return self.__response(error="Invalid method", status_code=405)
+            return self.__error("Invalid method", 405)
 
         if ("X-Signature-Ed25519" not in request.headers
                 or "X-Signature-Timestamp" not in request.headers):
-            return self.__response(error="Missing headers", status_code=400)
+            return self.__error("Missing headers", 400)
 
-        body = await request.read()
+        if request.content_type != "application/json":
+            return self.__error("Invalid content type", 415)
+
+        signature = request.headers["X-Signature-Ed25519"]
+        timestamp = request.headers["X-Signature-Timestamp"]
+
+        # Checks before verifying, as it's the most expensive step.
+        if not self.__fresh(timestamp):
+            return self.__error("Invalid request signature", 401)
+
+        if signature in self._signatures:
+            return await self.__replayed(self._signatures[signature])
+
+        if self.__full():
+            return self.__shed()
+
+        stages = self._upper._metrics.webhook_stages
+        started = time.perf_counter()
+
+        body = await self.__read(request)
+        if body is None:
+            return self.__error("Body too large", 413)
+
+        read = time.perf_counter()
+        stages.observe(read - started, "read")
 
         try:
-            webhook: WebhookModel = self._upper.webhook(
-                request.headers["X-Signature-Ed25519"],
-                request.headers["X-Signature-Timestamp"],
-                body
-            )
+            if self._executor:
+                await asyncio.get_event_loop().run_in_executor(
+                    self._executor,
+                    self._upper._verify,
+                    signature,
+                    timestamp,
+                    body
+                )
+            else:
+                self._upper._verify(signature, timestamp, body)
         except InvalidSignature:
-            return self.__response(
-                error="Invalid request signature", status_code=401
-            )
+            return self.__error("Invalid request signature", 401)
+
+        verified = time.perf_counter()
+        stages.observe(verified - read, "verify")
+
+        try:
+            data = self._upper._decode(body)
         except InvalidJson:
-            return self.__response(error="Invalid json", status_code=400)
+            return self.__error("Invalid json", 400)
+
+        if self._replay_cache:
+            self.__remember(
+                signature, None if data["type"] == PING else data.get("id")
+            )
+
+        decoded = time.perf_counter()
+        stages.observe(decoded - verified, "decode")
+
+        if data["type"] == PING:
+            return self.__response(PONG_BODY)
+
+        webhook = WebhookModel(data)
+        CURRENT_WEBHOOK.set(webhook)
 
         # Handles calling the event listeners.
-        if webhook.id in self._upper._global_funcs:
+        funcs = self._upper._router.resolve(webhook)
 
-            await self._upper._scheduler.spawn(
-                self._upper._call_listeners(
-                    self._upper._global_funcs[webhook.id],
-                    webhook
-                )
-            )
+        routed = time.perf_counter()
+        stages.observe(routed - decoded, "route")
+
+        if not funcs:
+            # Nothing would follow up a deferral, so
+            # tell the user instead of leaving them waiting.
+            return self.__response(UNKNOWN_COMMAND_BODY)
+
+        limited = None
+        limit = self._command_limits.get(webhook.data.name)
+        if limit is not None:
+            limited = webhook.data.name
+            if self._running[limited] >= limit:
+                return self.__shed()
+
+            # Counted before any await, so concurrent requests can't
+            # all pass the check. Released by the listener job.
+            self._running[limited] += 1
+
+        try:
+            cached = await self._interactions.claim(webhook.id)
+        except BaseException:
+            self.__release(limited)
+            raise
+
+        if cached is not None:
+            self.__release(limited)
+
+            # Redelivered, still being handled if IN_FLIGHT.
+            return self.__response(cached or DEFERRED_BODY)
+
+        # Checked again as reading, verifying & claiming awaited,
+        # nothing awaits between here and spawn.
+        if self.__full():
+            self.__release(limited)
+            await self._interactions.release(webhook.id)
+
+            return self.__shed()
+
+        dispatched = time.perf_counter()
+
+        try:
+            body = await self.__dispatch(funcs, webhook, limited)
+        except Exception:
+            await self._interactions.release(webhook.id)
+            raise
+
+        stages.observe(time.perf_counter() - dispatched, "handler")
+
+        await self._interactions.store(webhook.id, body)
 
-        elif (webhook.guild_id in self._upper._guild_funcs and
-                webhook.id in self._upper._guild_funcs[webhook.guild_id]):
+        return self.__response(body)
 
+    async def __dispatch(self, funcs: List[Callable], webhook: WebhookModel,
+                         limited: Optional[str]) -> bytes:
+        """Used to call listeners & encode their response.
+
+        Parameters
+        ----------
+        funcs : List[Callable]
+        webhook : WebhookModel
+        limited : Optional[str]
+            Command name counted against its limit,
+            released once listeners finish.
+
+        Returns
+        -------
+        bytes
+            Response body.
+        """
+
+        inline = asyncio.get_event_loop().create_future()
+
+        try:
             await self._upper._scheduler.spawn(
-                self._upper._call_listeners(
-                    self._upper._guild_funcs[webhook.guild_id][webhook.id],
-                    webhook
-                )
+                self.__listen(funcs, webhook, inline, limited)
             )
+        except BaseException:
+            self.__release(limited)
+            raise
+
+        done, _ = await asyncio.wait(
+            (inline,), timeout=self._response_timeout
+        )
+
+        if not done:
+            # The job sends the response itself once listeners finish,
+            # nothing here waits on the scheduler past the budget.
+            inline.cancel()
+
+            return DEFERRED_BODY
+
+        result = inline.result()
+        if result is None:
+            return DEFERRED_BODY
+
+        if isinstance(result, Message):
+            result = Response(CHANNEL_MESSAGE_WITH_SOURCE, result)
 
-        return self.__response({"type": webhook.type})
+        return self._upper._json.dumps(result._payload)
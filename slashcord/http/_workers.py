@@ -0,0 +1,266 @@
+"""MIT License
+
+Copyright (c) 2021 Slashcord
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import time
+
+from typing import List
+
+
+# Longest wait before respawning a worker which keeps
+# exiting before it starts serving.
+MAX_RESTART_DELAY = 60.0
+
+
+class Worker:
+    def __init__(self, process: multiprocessing.Process,
+                 heartbeat: multiprocessing.Value,
+                 failures: int = 0) -> None:
+        """Used to track a worker process.
+
+        Parameters
+        ----------
+        process : multiprocessing.Process
+        heartbeat : multiprocessing.Value
+            time.time() of the worker's last heartbeat,
+            0 until the worker is serving.
+        failures : int, optional
+            Workers in this slot in a row which exited
+            before serving, by default 0
+        """
+
+        self.process = process
+        self.heartbeat = heartbeat
+        self.failures = failures
+
+        # time.time() to respawn at once exited, 0 if running.
+        self.restart_at = 0.0
+
+
+class WorkerSupervisor:
+    def __init__(self, upper: object, workers: int,
+                 health_interval: float = 1.0,
+                 health_timeout: float = 10.0,
+                 shutdown_timeout: float = 30.0) -> None:
+        """Used to run the webhook server across worker processes
+           sharing one port through SO_REUSEPORT.
+
+        Parameters
+        ----------
+        upper : object
+            SlashCord instance
+        workers : int
+        health_interval : float, optional
+            by default 1.0
+        health_timeout : float, optional
+            by default 10.0
+        shutdown_timeout : float, optional
+            by default 30.0
+
+        Notes
+        -----
+        Workers are forked, so listeners don't need to be picklable.
+        Each worker has its own event loop, ClientSession,
+        scheduler & rate limiter.
+        """
+
+        self._upper = upper
+        self._workers_count = workers
+        self._health_interval = health_interval
+        self._health_timeout = health_timeout
+        self._shutdown_timeout = shutdown_timeout
+
+        self._context = multiprocessing.get_context("fork")
+        self._workers: List[Worker] = []
+
+        self._stopping = False
+        self._restarting = False
+
+    def run(self) -> None:
+        """Used to register commands, fork workers & supervise
+           them until SIGINT or SIGTERM.
+        """
+
+        # Commands are registered once here, workers
+        # inherit the resolved command ids when forked.
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._upper._register())
+        finally:
+            loop.close()
+
+        self._upper._server._reuse_port = True
+
+        signal.signal(signal.SIGINT, self.__stop)
+        signal.signal(signal.SIGTERM, self.__stop)
+        signal.signal(signal.SIGHUP, self.__restart)
+
+        self._workers = [self._spawn() for _ in range(self._workers_count)]
+
+        try:
+            while not self._stopping:
+                time.sleep(self._health_interval)
+
+                if self._restarting:
+                    self._restarting = False
+                    self._rolling_restart()
+                else:
+                    self._check_health()
+        finally:
+            for worker in self._workers:
+                self._terminate(worker)
+
+    def __stop(self, *args) -> None:
+        self._stopping = True
+
+    def __restart(self, *args) -> None:
+        self._restarting = True
+
+    def _spawn(self, failures: int = 0) -> Worker:
+        heartbeat = self._context.Value("d", 0.0)
+
+        process = self._context.Process(
+            target=self._serve, args=(heartbeat,), daemon=True
+        )
+        process.start()
+
+        logging.info("Started worker {}".format(process.pid))
+
+        return Worker(process, heartbeat, failures)
+
+    def _terminate(self, worker: Worker) -> None:
+        """Used to stop worker gracefully, killing it if it
+           doesn't stop within shutdown_timeout.
+        """
+
+        if worker.process.is_alive():
+            worker.process.terminate()
+            # Grace for closing the session after listeners finish.
+            worker.process.join(self._shutdown_timeout + 1.0)
+
+            if worker.process.is_alive():
+                logging.warning(
+                    "Killing worker {}".format(worker.process.pid)
+                )
+                worker.process.kill()
+                worker.process.join()
+
+    def _check_health(self) -> None:
+        now = time.time()
+
+        for index, worker in enumerate(self._workers):
+            if worker.restart_at:
+                if now >= worker.restart_at:
+                    self._workers[index] = self._spawn(worker.failures)
+
+                continue
+
+            if not worker.process.is_alive():
+                logging.error("Worker {} exited with {}".format(
+                    worker.process.pid, worker.process.exitcode
+                ))
+
+                if not worker.heartbeat.value:
+                    # Exited before serving, e.g. failing on startup,
+                    # so backs off instead of respawning every check.
+                    worker.failures += 1
+                    worker.restart_at = now + min(
+                        self._health_interval * 2 ** worker.failures,
+                        MAX_RESTART_DELAY
+                    )
+
+                    continue
+            elif (worker.heartbeat.value and
+                    now - worker.heartbeat.value > self._health_timeout):
+                logging.error("Worker {} stopped responding".format(
+                    worker.process.pid
+                ))
+                worker.process.kill()
+                worker.process.join()
+            else:
+                continue
+
+            self._workers[index] = self._spawn()
+
+    def _rolling_restart(self) -> None:
+        """Used to replace workers one at a time, each new worker
+           serving before the old one is stopped.
+        """
+
+        for index, worker in enumerate(self._workers):
+            if self._stopping:
+                return
+
+            replacement = self._spawn()
+
+            deadline = time.time() + self._health_timeout
+            while (not replacement.heartbeat.value
+                    and replacement.process.is_alive()
+                    and time.time() < deadline):
+                time.sleep(0.05)
+
+            self._workers[index] = replacement
+            self._terminate(worker)
+
+    def _serve(self, heartbeat: multiprocessing.Value) -> None:
+        """Entry point of worker processes.
+        """
+
+        # Shutdown is driven by the supervisor's SIGTERM.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self._serve_async(heartbeat))
+        finally:
+            loop.close()
+
+    async def _serve_async(self, heartbeat: multiprocessing.Value) -> None:
+        stop = asyncio.Event()
+        asyncio.get_event_loop().add_signal_handler(signal.SIGTERM, stop.set)
+
+        await self._upper.startup(register_commands=False)
+
+        logging.info("Worker {} serving".format(os.getpid()))
+
+        try:
+            while not stop.is_set():
+                # Only updated while the event loop is responsive.
+                heartbeat.value = time.time()
+
+                try:
+                    await asyncio.wait_for(
+                        stop.wait(), self._health_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            await self._upper.shutdown(self._shutdown_timeout)
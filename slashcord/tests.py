@@ -21,24 +21,69 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import os
+import time
+import json
+import signal
+import socket
+import asyncio
 import asynctest
+import tempfile
+import multiprocessing
 
-from . import SlashCord, Command, CommandChoice, CommandModel
+from aiohttp import ClientSession, ClientError
+from nacl.signing import SigningKey
+
+from . import (
+    SlashCord, Command, CommandChoice, CommandModel, HttpClientConfig,
+    RetryPolicy, HttpException, FakeDiscord, WebhookModel, InvalidSignature,
+    WebhookServer, Message, InvalidJson, Hook, OutboundQueueFull,
+    DeployState, TooManyOptions, TooManyChoices, CommandTooLong,
+    MissingOptionType
+)
+from ._registry import CommandRegistry, command_changed
+from ._router import Router
+from ._cache import CommandCache, fingerprint
+from ._settings import encode_commands
+from ._metrics import Histogram
+from ._dedup import (
+    InteractionCache, MemoryInteractionCache, SharedInteractionCache,
+    IN_FLIGHT
+)
+from ._json import JsonCodec, StdlibJsonCodec, OrjsonCodec, orjson
+from .http._ratelimit import RateLimiter, split_route, PRUNE_AFTER
+from .http._queue import (
+    OutboundQueue, classify, INTERACTION, FOLLOW_UP, MANAGEMENT
+)
+from .http._workers import WorkerSupervisor
 
 
 class TestSlashCord(asynctest.TestCase):
     use_default_loop = True
 
-    token: str
-    client_id: int
-    public_key: str
-    guild_id: int
+    # Tests run against FakeDiscord unless a token is given.
+    token: str = ""
+    client_id: int = 0
+    public_key: str = ""
+    guild_id: int = 0
 
     async def setUp(self) -> None:
+        if self.token:
+            self.discord = None
+            public_key = self.public_key
+            http_client = HttpClientConfig()
+        else:
+            self.discord = FakeDiscord(self.client_id)
+            await self.discord.start()
+
+            public_key = SigningKey.generate().verify_key.encode().hex()
+            http_client = HttpClientConfig(base_url=self.discord.base_url)
+
         self.slash_cord = SlashCord(
             token=self.token,
             client_id=self.client_id,
-            public_key=self.public_key
+            public_key=public_key,
+            http_client=http_client
         )
 
         self.guild = self.slash_cord.guild(self.guild_id)
@@ -48,6 +93,9 @@ class TestSlashCord(asynctest.TestCase):
     async def tearDown(self) -> None:
         await self.slash_cord.shutdown()
 
+        if self.discord:
+            await self.discord.close()
+
     async def test_getting_commads(self) -> None:
         async for command in self.slash_cord.commands():
             self.assertIsInstance(command, CommandModel)
@@ -68,3 +116,1093 @@ class TestSlashCord(asynctest.TestCase):
         )
 
         self.assertIsInstance(model, CommandModel)
+
+    async def test_sync_commands(self) -> None:
+        @self.guild.listener(Command("testing", "Command created by SlashCord"))
+        async def testing(webhook) -> None:
+            pass
+
+        report = await self.slash_cord.sync_commands()
+        self.assertEqual(report.created, [(str(self.guild_id), "testing")])
+
+        report = await self.slash_cord.sync_commands()
+        self.assertEqual(
+            report.unchanged, [(str(self.guild_id), "testing")]
+        )
+        self.assertFalse(report.changed)
+
+    async def test_deploy_commands(self) -> None:
+        if not self.discord:
+            self.skipTest("Deploys to made up guilds")
+
+        commands = [Command("testing", "Command created by SlashCord")]
+        state = DeployState()
+
+        self.discord.inject_error(400)
+        results = [
+            result async for result in self.slash_cord.deploy_commands(
+                commands, range(1, 6), concurrency=2, state=state
+            )
+        ]
+
+        failed = [result.guild_id for result in results if not result.ok]
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len(failed), 1)
+
+        results = [
+            result async for result in self.slash_cord.deploy_commands(
+                commands, range(1, 6), state=state
+            )
+        ]
+
+        self.assertEqual([result.guild_id for result in results], failed)
+        self.assertEqual(results[0].commands[0].name, "testing")
+        self.assertEqual(len(self.discord.commands), 5)
+
+
+class TestFrozenCommand(asynctest.TestCase):
+    def test_freeze(self) -> None:
+        command = Command("testing", "Command created by SlashCord").option(
+            "choice", "Choices you can select"
+        ).string([CommandChoice("Choice 1", "choice_1")])
+
+        frozen = command.freeze()
+
+        self.assertIs(frozen.freeze(), frozen)
+        self.assertEqual(json.loads(frozen._json), command._payload)
+        self.assertEqual(fingerprint(frozen), fingerprint(command))
+        self.assertEqual(
+            json.loads(encode_commands([frozen, command])),
+            [command._payload, command._payload]
+        )
+
+        command.option("later", "Added after freezing").boolean()
+        self.assertEqual(len(frozen._payload["options"]), 1)
+
+        with self.assertRaises(AttributeError):
+            frozen._name = "changed"
+
+        with self.assertRaises(TypeError):
+            frozen._payload["name"] = "changed"
+
+    def test_limits(self) -> None:
+        command = Command("testing", "Command created by SlashCord")
+        for index in range(26):
+            command.option("option{}".format(index), "Option").boolean()
+
+        with self.assertRaises(TooManyOptions):
+            command.freeze()
+
+        command = Command("testing", "Command created by SlashCord").option(
+            "choice", "Choices you can select"
+        ).integer([CommandChoice("Choice", index) for index in range(26)])
+
+        with self.assertRaises(TooManyChoices):
+            command.freeze()
+
+        command = Command("testing", "a" * 100)
+        for index in range(25):
+            command.option("option{}".format(index), "a" * 100).string([
+                CommandChoice("a" * 100, "choice") for _ in range(2)
+            ])
+
+        with self.assertRaises(CommandTooLong):
+            command.freeze()
+
+        command = Command("testing", "Command created by SlashCord")
+        command.option("untyped", "Option without a type")
+
+        with self.assertRaises(MissingOptionType):
+            command.freeze()
+
+
+class TestRateLimiter(asynctest.TestCase):
+    def test_split_route(self) -> None:
+        route, major = split_route(
+            "PATCH", "applications/1/guilds/2/commands/3"
+        )
+
+        self.assertEqual(
+            route, "PATCH applications/{applications}/guilds/{guilds}"
+            "/commands/:id"
+        )
+        self.assertEqual(major, ("1", "2"))
+
+    async def test_waits_for_reset(self) -> None:
+        ratelimiter = RateLimiter()
+        route, major = split_route("POST", "applications/1/commands")
+
+        ratelimiter.update(route, major, {
+            "X-RateLimit-Bucket": "abc",
+            "X-RateLimit-Limit": "5",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset-After": "0.2"
+        })
+
+        loop = asyncio.get_event_loop()
+        started = loop.time()
+        await ratelimiter.acquire(route, major)
+
+        self.assertGreaterEqual(loop.time() - started, 0.15)
+
+    async def test_prunes_buckets(self) -> None:
+        ratelimiter = RateLimiter()
+
+        for token in range(PRUNE_AFTER * 4):
+            route, major = split_route(
+                "PATCH", "webhooks/1/{}/messages/@original".format(token)
+            )
+            await ratelimiter.acquire(route, major)
+            ratelimiter.update(route, major, {
+                "X-RateLimit-Remaining": "4",
+                "X-RateLimit-Reset-After": "0"
+            })
+
+        self.assertLessEqual(len(ratelimiter._buckets), PRUNE_AFTER)
+
+
+class TestCommandRegistry(asynctest.TestCase):
+    def test_scopes(self) -> None:
+        registry = CommandRegistry()
+        command = Command("testing", "Command created by SlashCord")
+
+        registry.add(command, print)
+        registry.add(command, repr)
+        registry.add(command, print, guild_id="1234")
+        registry.add(command, repr, guild_id=1234)
+
+        self.assertEqual(registry.scopes(), [None, "1234"])
+        self.assertEqual(
+            registry.listeners("testing", 1234), {(): [print, repr]}
+        )
+        self.assertEqual(registry.commands(), [command])
+        self.assertEqual(
+            registry.listeners("testing"), {(): [print, repr]}
+        )
+
+    def test_command_changed(self) -> None:
+        command = Command("testing", "Command created by SlashCord")
+        model = CommandModel(
+            id="1", application_id="2", name="testing",
+            description="Command created by SlashCord", version="3"
+        )
+
+        self.assertFalse(command_changed(model, command))
+
+        command.option("choice", "Choices you can select").string()
+        self.assertTrue(command_changed(model, command))
+
+
+class TestCommandCache(asynctest.TestCase):
+    def test_lookup(self) -> None:
+        path = os.path.join(tempfile.mkdtemp(), "cache.json")
+        command = Command("testing", "Command created by SlashCord")
+
+        cache = CommandCache(path)
+        cache.store("scope", [command], {"testing": "1234"})
+        cache.save()
+
+        cache = CommandCache(path)
+        self.assertEqual(
+            cache.lookup("scope", [command]), {"testing": "1234"}
+        )
+
+        command.option("choice", "Changed command").string()
+        self.assertIsNone(cache.lookup("scope", [command]))
+
+    def test_deploy_state(self) -> None:
+        path = os.path.join(tempfile.mkdtemp(), "deploy.json")
+        commands = [Command("testing", "Command created by SlashCord")]
+
+        state = DeployState(path, save_every=2)
+        state.begin(commands)
+
+        state.complete("1")
+        self.assertFalse(os.path.isfile(path))
+
+        # Saved without waiting for the deploy to finish.
+        state.complete("2")
+        state = DeployState(path)
+        state.begin(commands)
+        self.assertTrue(state.completed("1") and state.completed("2"))
+
+
+class TestInteractionCache(asynctest.TestCase):
+    async def check(self, cache) -> None:
+        self.assertIsNone(await cache.claim("1"))
+        self.assertEqual(await cache.claim("1"), IN_FLIGHT)
+
+        await cache.store("1", b"{}")
+        self.assertEqual(await cache.claim("1"), b"{}")
+
+        self.assertIsNone(await cache.claim("2"))
+        await cache.release("2")
+        self.assertIsNone(await cache.claim("2"))
+
+    async def test_memory(self) -> None:
+        await self.check(MemoryInteractionCache())
+
+    def test_incomplete(self) -> None:
+        class ClaimOnly(InteractionCache):
+            async def claim(self, interaction_id: str):
+                return None
+
+        with self.assertRaises(TypeError):
+            ClaimOnly()
+
+    async def test_shared(self) -> None:
+        cache = SharedInteractionCache(max_size=2)
+        try:
+            await self.check(cache)
+
+            await cache.store("3", b"{}")
+            self.assertEqual(sorted(cache._entries.keys()), ["2", "3"])
+            self.assertEqual(list(cache._order), ["2", "3"])
+        finally:
+            cache._manager.shutdown()
+
+    async def test_eviction(self) -> None:
+        cache = MemoryInteractionCache(ttl=0.05, max_size=2)
+
+        for interaction_id in ("1", "2", "3"):
+            await cache.claim(interaction_id)
+        self.assertEqual(list(cache._entries), ["2", "3"])
+
+        await asyncio.sleep(0.1)
+        self.assertIsNone(await cache.claim("2"))
+
+
+class TestMetrics(asynctest.TestCase):
+    def test_histogram(self) -> None:
+        histogram = Histogram("latency", "Latency.", ("stage",), (0.1, 1.0))
+
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value, 'say "hi"')
+
+        self.assertEqual(histogram.render()[2:], [
+            'latency_bucket{stage="say \\"hi\\"",le="0.1"} 1',
+            'latency_bucket{stage="say \\"hi\\"",le="1.0"} 2',
+            'latency_bucket{stage="say \\"hi\\"",le="+Inf"} 3',
+            'latency_sum{stage="say \\"hi\\""} 5.55',
+            'latency_count{stage="say \\"hi\\""} 3'
+        ])
+
+
+class TestOutboundQueue(asynctest.TestCase):
+    async def test_priority(self) -> None:
+        queue = OutboundQueue(concurrency=1, max_queued=3)
+        order = []
+
+        async def send(priority: int, key: str) -> None:
+            await queue.acquire(priority, key)
+            order.append((priority, key))
+            await asyncio.sleep(0)
+            queue.release()
+
+        await queue.acquire(INTERACTION, "held")
+
+        tasks = [
+            asyncio.ensure_future(send(priority, key))
+            for priority, key in (
+                (MANAGEMENT, "a"), (MANAGEMENT, "a"), (MANAGEMENT, "e"),
+                (FOLLOW_UP, "b"), (INTERACTION, "c")
+            )
+        ]
+        await asyncio.sleep(0)
+
+        with self.assertRaises(OutboundQueueFull):
+            await queue.acquire(MANAGEMENT, "b")
+
+        # Fair between keys within a priority.
+        tasks.append(asyncio.ensure_future(send(FOLLOW_UP, "b")))
+        tasks.append(asyncio.ensure_future(send(FOLLOW_UP, "d")))
+        await asyncio.sleep(0)
+
+        queue.release()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(order, [
+            (INTERACTION, "c"), (FOLLOW_UP, "b"), (FOLLOW_UP, "d"),
+            (FOLLOW_UP, "b"), (MANAGEMENT, "a"), (MANAGEMENT, "e"),
+            (MANAGEMENT, "a")
+        ])
+        self.assertEqual(queue._active, 0)
+
+    def test_classify(self) -> None:
+        self.assertEqual(
+            classify("webhooks/1/abc/messages/@original"), INTERACTION
+        )
+        self.assertEqual(classify("webhooks/1/abc"), FOLLOW_UP)
+        self.assertEqual(classify("applications/1/commands"), MANAGEMENT)
+
+
+class TestHttpClientConfig(asynctest.TestCase):
+    async def test_shared_session(self) -> None:
+        session = ClientSession()
+
+        slash_cord = SlashCord(
+            token="",
+            client_id=0,
+            public_key=SigningKey.generate().verify_key.encode().hex(),
+            webhook_server=None,
+            http_client=HttpClientConfig(session=session)
+        )
+
+        await slash_cord.startup()
+        self.assertIs(slash_cord._requests, session)
+
+        await slash_cord.shutdown()
+        self.assertFalse(session.closed)
+
+        await session.close()
+
+
+class TestRetryPolicy(asynctest.TestCase):
+    async def setUp(self) -> None:
+        self.discord = FakeDiscord()
+        await self.discord.start()
+
+        self.slash_cord = SlashCord(
+            token="",
+            client_id=0,
+            public_key=SigningKey.generate().verify_key.encode().hex(),
+            webhook_server=None,
+            http_client=HttpClientConfig(
+                retry=RetryPolicy(backoff=0.01),
+                base_url=self.discord.base_url
+            )
+        )
+
+        await self.slash_cord.startup()
+
+    async def tearDown(self) -> None:
+        await self.slash_cord.shutdown()
+        await self.discord.close()
+
+    async def test_retries_idempotent(self) -> None:
+        self.discord.inject_error(503, times=2)
+
+        self.assertEqual(
+            [command async for command in self.slash_cord.commands()], []
+        )
+        self.assertEqual(len(self.discord.requests), 3)
+
+    async def test_doesnt_retry_post(self) -> None:
+        self.discord.inject_error(503)
+
+        with self.assertRaises(HttpException):
+            await self.slash_cord.create_command(
+                Command("testing", "Command created by SlashCord")
+            )
+
+        self.assertEqual(len(self.discord.requests), 1)
+
+    async def test_waits_for_rate_limit(self) -> None:
+        self.discord.rate_limit = 2
+        self.discord.rate_limit_window = 0.2
+
+        for _ in range(5):
+            [command async for command in self.slash_cord.commands()]
+
+        # Limiter should wait for buckets to reset instead of being
+        # rejected with 429s.
+        self.assertEqual(len(self.discord.requests), 5)
+
+
+class TestJsonCodec(asynctest.TestCase):
+    def test_round_trip(self) -> None:
+        codecs = [StdlibJsonCodec()]
+        if orjson:
+            codecs.append(OrjsonCodec())
+
+        for codec in codecs:
+            data = codec.dumps({"type": 1, "name": "testing"})
+
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(codec.loads(data), {"type": 1, "name": "testing"})
+
+            with self.assertRaises(ValueError):
+                codec.loads(b"{")
+
+    def test_incomplete(self) -> None:
+        class LoadsOnly(JsonCodec):
+            def loads(self, data: bytes):
+                return json.loads(data)
+
+        with self.assertRaises(TypeError):
+            LoadsOnly()
+
+
+class TestWebhook(asynctest.TestCase):
+    def setUp(self) -> None:
+        self.signing_key = SigningKey.generate()
+
+        self.slash_cord = SlashCord(
+            token="",
+            client_id=0,
+            public_key=self.signing_key.verify_key.encode().hex(),
+            webhook_server=None
+        )
+
+        self.body = b'{"id": "1", "type": 1, "token": "abc", "version": 1}'
+        self.timestamp = "1614000000"
+
+    def test_valid_signature(self) -> None:
+        signature = self.signing_key.sign(
+            self.timestamp.encode() + self.body
+        ).signature.hex()
+
+        webhook = self.slash_cord.webhook(signature, self.timestamp, self.body)
+
+        self.assertIsInstance(webhook, WebhookModel)
+        self.assertEqual(webhook.type, 1)
+
+    def test_invalid_signature(self) -> None:
+        signature = self.signing_key.sign(b"forged").signature.hex()
+
+        with self.assertRaises(InvalidSignature):
+            self.slash_cord.webhook(signature, self.timestamp, self.body)
+
+        with self.assertRaises(InvalidSignature):
+            self.slash_cord.webhook("not hex", self.timestamp, self.body)
+
+    def test_lazy_model(self) -> None:
+        webhook = WebhookModel({
+            "id": "1", "type": 2, "token": "abc",
+            "data": {"id": "2", "name": "testing", "options": [
+                {"name": "sub", "type": 1, "options": [
+                    {"name": "value", "type": 4, "value": 5}
+                ]}
+            ]},
+            "member": {
+                "user": {"id": "3", "username": "user",
+                         "discriminator": "0001"},
+                "roles": [], "joined_at": "2021-02-20T10:00:00+00:00",
+                "deaf": False, "mute": False
+            }
+        })
+
+        self.assertIs(webhook.data, webhook.data)
+        self.assertEqual(webhook.data.options[0].options[0].value, 5)
+        self.assertEqual(webhook.member.user.id, "3")
+        self.assertEqual(webhook.member.joined_at.year, 2021)
+        self.assertIsNone(webhook.member.premium_since)
+        self.assertIsNone(webhook.guild_id)
+
+        with self.assertRaises(AttributeError):
+            webhook.extra = None
+
+    def test_invalid_json(self) -> None:
+        for body in (b"[]", b'{"type": 1}', b"{"):
+            with self.assertRaises(InvalidJson):
+                self.slash_cord._decode(body)
+
+
+class TestRouter(asynctest.TestCase):
+    def setUp(self) -> None:
+        self.router = Router()
+
+        self.router.add(None, "testing", "1", {
+            (): [print],
+            ("group", "sub"): [repr]
+        })
+
+    def webhook(self, **data) -> WebhookModel:
+        return WebhookModel(
+            id="2", type=2, token="abc", guild_id="3", data=data
+        )
+
+    def test_by_id(self) -> None:
+        self.assertEqual(
+            self.router.resolve(self.webhook(id="1", name="renamed")),
+            [print]
+        )
+
+    def test_guild_falls_back_to_global(self) -> None:
+        self.assertEqual(
+            self.router.resolve(self.webhook(id="4", name="testing")),
+            [print]
+        )
+
+    def test_sub_command_path(self) -> None:
+        webhook = self.webhook(id="1", name="testing", options=[{
+            "name": "group", "type": 2, "options": [{
+                "name": "sub", "type": 1, "options": [{
+                    "name": "choice", "type": 3, "value": "choice_1"
+                }]
+            }]
+        }])
+
+        self.assertEqual(self.router.resolve(webhook), [repr])
+
+    def test_unknown(self) -> None:
+        self.assertEqual(
+            self.router.resolve(self.webhook(id="4", name="unknown")), []
+        )
+
+
+class TestInteractions(asynctest.TestCase):
+    async def setUp(self) -> None:
+        self.signing_key = SigningKey.generate()
+
+        self.discord = FakeDiscord()
+        await self.discord.start()
+
+        self.slash_cord = SlashCord(
+            token="",
+            client_id=0,
+            public_key=self.signing_key.verify_key.encode().hex(),
+            webhook_server=WebhookServer("127.0.0.1", 0),
+            http_client=HttpClientConfig(base_url=self.discord.base_url)
+        )
+
+        self.command = Command("testing", "Command created by SlashCord")
+        self.session = None
+
+    async def tearDown(self) -> None:
+        if self.session:
+            await self.session.close()
+            await self.slash_cord.shutdown()
+
+        await self.discord.close()
+
+    async def start(self) -> None:
+        await self.slash_cord.startup()
+
+        self.session = ClientSession()
+        self.url = "http://127.0.0.1:{}/".format(
+            self.slash_cord._server._port
+        )
+
+    def sign(self, type: int = 2, timestamp: float = None,
+             **payload) -> tuple:
+        payload.setdefault("id", "1")
+        payload.setdefault("token", "abc")
+        payload.setdefault("data", {"id": "0", "name": "testing"})
+
+        body = json.dumps(dict(payload, type=type)).encode()
+        timestamp = str(int(timestamp or time.time()))
+
+        return body, {
+            "X-Signature-Ed25519": self.signing_key.sign(
+                timestamp.encode() + body
+            ).signature.hex(),
+            "X-Signature-Timestamp": timestamp,
+            "Content-Type": "application/json"
+        }
+
+    async def post(self, body: bytes, headers: dict) -> tuple:
+        async with self.session.post(
+                self.url, data=body, headers=headers) as resp:
+            return resp.status, await resp.json()
+
+    async def interact(self, type: int = 2, **payload) -> tuple:
+        return await self.post(*self.sign(type, **payload))
+
+    async def test_freezes_once(self) -> None:
+        frozen = []
+
+        class Counted(Command):
+            def freeze(self):
+                frozen.append(self._name)
+                return super().freeze()
+
+        @self.slash_cord.listener(
+            Counted("testing", "Command created by SlashCord")
+        )
+        async def testing(webhook: WebhookModel) -> None:
+            pass
+
+        self.slash_cord._command_cache = CommandCache(
+            os.path.join(tempfile.mkdtemp(), "cache.json")
+        )
+        await self.start()
+        await self.slash_cord.sync_commands()
+
+        self.assertEqual(frozen, ["testing", "testing"])
+        self.assertEqual(len(self.discord.commands), 1)
+
+    async def test_ping(self) -> None:
+        await self.start()
+
+        self.assertEqual(await self.interact(type=1), (200, {"type": 1}))
+
+    async def test_unknown_command(self) -> None:
+        await self.start()
+
+        status, data = await self.interact()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data["type"], 4)
+        self.assertEqual(data["data"]["flags"], 64)
+
+    async def test_inline_message(self) -> None:
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            return Message("Hello", ephemeral=True)
+
+        await self.start()
+
+        status, data = await self.interact()
+
+        self.assertEqual(status, 200)
+        self.assertEqual(data["type"], 4)
+        self.assertEqual(data["data"]["content"], "Hello")
+        self.assertEqual(data["data"]["flags"], 64)
+
+    async def test_first_response(self) -> None:
+        finished = []
+
+        @self.slash_cord.listener(self.command)
+        async def slow(webhook: WebhookModel) -> None:
+            await asyncio.sleep(0.5)
+            finished.append("slow")
+
+        @self.slash_cord.listener(self.command)
+        async def fast(webhook: WebhookModel) -> Message:
+            return Message("Fast")
+
+        self.slash_cord._server._response_timeout = 2.0
+        await self.start()
+
+        started = time.time()
+        status, data = await self.interact()
+
+        # Answered without waiting on the slow listener.
+        self.assertLess(time.time() - started, 0.3)
+        self.assertEqual(data["data"]["content"], "Fast")
+        self.assertEqual(finished, [])
+
+        await self.session.close()
+        self.session = None
+        await self.slash_cord.shutdown()
+
+        self.assertEqual(finished, ["slow"])
+
+    async def test_deferred_message(self) -> None:
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await asyncio.sleep(0.2)
+            return Message("Late")
+
+        self.slash_cord._server._response_timeout = 0.05
+        await self.start()
+
+        self.assertEqual(await self.interact(), (200, {"type": 5}))
+
+        await asyncio.sleep(0.4)
+
+        self.assertEqual(
+            self.discord.messages["abc"][0]["content"], "Late"
+        )
+
+        await self.slash_cord.create_followup_message(
+            "abc", Message("Follow up")
+        )
+        self.assertEqual(
+            self.discord.messages["abc"][1]["content"], "Follow up"
+        )
+
+    async def test_deferral_under_load(self) -> None:
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await asyncio.sleep(0.5)
+            return Message("Late")
+
+        server = self.slash_cord._server
+        server._response_timeout = 0.05
+        server._limit = 2
+        server._pending_limit = 2
+        await self.start()
+
+        started = time.time()
+        responses = await asyncio.gather(*[
+            self.interact(id=str(index), token=str(index))
+            for index in range(3)
+        ])
+
+        # Acks aren't held back by the full scheduler.
+        self.assertLess(time.time() - started, 0.3)
+        self.assertEqual(responses, [(200, {"type": 5})] * 3)
+
+        await asyncio.sleep(1.2)
+        self.assertEqual(len(self.discord.messages), 3)
+
+    async def test_graceful_shutdown(self) -> None:
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await asyncio.sleep(0.2)
+            return Message("Finished")
+
+        self.slash_cord._server._response_timeout = 0.05
+        await self.start()
+
+        self.assertEqual(await self.interact(), (200, {"type": 5}))
+
+        await self.session.close()
+        self.session = None
+        await self.slash_cord.shutdown()
+
+        self.assertEqual(
+            self.discord.messages["abc"][0]["content"], "Finished"
+        )
+
+    async def test_load_shedding(self) -> None:
+        release = asyncio.Event()
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await release.wait()
+            return Message("Done")
+
+        self.slash_cord._server._command_limits = {"testing": 1}
+        await self.start()
+
+        first = asyncio.ensure_future(self.interact())
+        await asyncio.sleep(0.05)
+
+        status, data = await self.interact(id="2")
+        self.assertEqual(status, 503)
+
+        release.set()
+        self.assertEqual((await first)[1]["type"], 4)
+        self.assertEqual(self.slash_cord._server._running["testing"], 0)
+
+    async def test_command_limit_races(self) -> None:
+        class SlowCache(MemoryInteractionCache):
+            async def claim(self, interaction_id: str):
+                await asyncio.sleep(0.1)
+                return await super().claim(interaction_id)
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            return Message("Done")
+
+        server = self.slash_cord._server
+        server._command_limits = {"testing": 1}
+        server._interactions = SlowCache()
+        await self.start()
+
+        statuses = [status for status, _ in await asyncio.gather(*[
+            self.interact(id=str(index)) for index in range(3)
+        ])]
+
+        self.assertEqual(sorted(statuses), [200, 503, 503])
+        self.assertEqual(server._running["testing"], 0)
+
+    async def test_pending_limit_races(self) -> None:
+        class SlowCache(MemoryInteractionCache):
+            async def claim(self, interaction_id: str):
+                await asyncio.sleep(0.1)
+                return await super().claim(interaction_id)
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await asyncio.sleep(0.3)
+            return Message("Done")
+
+        server = self.slash_cord._server
+        server._limit = 1
+        server._pending_limit = 1
+        server._response_timeout = 0.05
+        server._interactions = SlowCache()
+        await self.start()
+
+        started = time.time()
+        statuses = [status for status, _ in await asyncio.gather(*[
+            self.interact(id=str(index), token=str(index))
+            for index in range(4)
+        ])]
+
+        # Shed instead of waiting on the full scheduler.
+        self.assertLess(time.time() - started, 0.3)
+        self.assertEqual(sorted(statuses), [200, 200, 503, 503])
+        self.assertEqual(len(server._interactions._entries), 2)
+
+    async def test_listener_errors(self) -> None:
+        errors = []
+
+        @self.slash_cord.error_handler
+        async def on_error(error: Exception, webhook: WebhookModel,
+                           func) -> None:
+            errors.append((type(error), func.__name__))
+
+        @self.slash_cord.listener(self.command)
+        async def failing(webhook: WebhookModel) -> None:
+            raise ValueError()
+
+        @self.slash_cord.listener(self.command)
+        async def slow(webhook: WebhookModel) -> None:
+            await asyncio.sleep(1)
+
+        @self.slash_cord.listener(self.command)
+        def blocking(webhook: WebhookModel) -> Message:
+            time.sleep(0.05)
+            return Message("Sync")
+
+        self.slash_cord._server._listener_timeout = 0.1
+        await self.start()
+
+        status, data = await self.interact()
+
+        self.assertEqual(data["data"]["content"], "Sync")
+
+        # The slow listener times out after the response is sent.
+        await asyncio.sleep(0.2)
+        self.assertEqual(dict(errors), {
+            ValueError: "failing", asyncio.TimeoutError: "slow"
+        })
+
+    async def test_filters(self) -> None:
+        self.slash_cord._server._max_body_size = 512
+        await self.start()
+
+        body, headers = self.sign(type=1)
+        self.assertEqual((await self.post(body, headers))[0], 200)
+        # Replayed
+        self.assertEqual((await self.post(body, headers))[0], 401)
+
+        self.assertEqual(
+            (await self.post(*self.sign(type=1, id="2",
+                                        timestamp=time.time() - 600)))[0],
+            401
+        )
+
+        self.assertEqual(
+            (await self.post(*self.sign(type=1, id="3", pad="a" * 512)))[0],
+            413
+        )
+
+        body, headers = self.sign(type=1, id="4")
+        headers["Content-Type"] = "text/plain"
+        self.assertEqual((await self.post(body, headers))[0], 415)
+
+    async def test_redelivery(self) -> None:
+        calls = []
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            calls.append(webhook.id)
+            return Message("Once")
+
+        await self.start()
+
+        first = await self.interact()
+        # Redelivered with a new signature.
+        second = await self.post(*self.sign(timestamp=time.time() - 1))
+
+        self.assertEqual(first, second)
+        self.assertEqual(calls, ["1"])
+
+        # Byte identical retry, e.g. from a proxy.
+        body, headers = self.sign(id="2")
+        first = await self.post(body, headers)
+        second = await self.post(body, headers)
+
+        self.assertEqual(first, second)
+        self.assertEqual(first[1]["data"]["content"], "Once")
+        self.assertEqual(calls, ["1", "2"])
+
+    async def test_metrics(self) -> None:
+        class BrokenCache(MemoryInteractionCache):
+            async def claim(self, interaction_id: str):
+                raise RuntimeError()
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> None:
+            await asyncio.sleep(0.1)
+
+        server = self.slash_cord._server
+        server._metrics_path = "/metrics"
+        server._response_timeout = 0.01
+        await self.start()
+
+        await self.interact(type=1)
+        async for _ in self.slash_cord.commands():
+            pass
+
+        # Deferred, still recorded once the listener finishes.
+        await self.interact()
+        await asyncio.sleep(0.2)
+
+        server._interactions = BrokenCache()
+        body, headers = self.sign(id="2")
+        async with self.session.post(
+                self.url, data=body, headers=headers) as resp:
+            self.assertEqual(resp.status, 500)
+
+        async with self.session.get(self.url + "metrics") as resp:
+            self.assertEqual(resp.status, 200)
+            text = await resp.text()
+
+        self.assertIn(
+            'slashcord_webhook_stage_seconds_count{stage="verify"} 3', text
+        )
+        self.assertIn(
+            'slashcord_webhook_responses_total{status="200"} 2', text
+        )
+        self.assertIn(
+            'slashcord_webhook_responses_total{status="500"} 1', text
+        )
+        self.assertIn(
+            'slashcord_listener_seconds_count{command="testing"} 1', text
+        )
+        self.assertIn(
+            'slashcord_rest_responses_total{route="GET applications/'
+            '{applications}/commands",status="200"} 1', text
+        )
+
+    async def test_hooks(self) -> None:
+        events = []
+
+        class Recorder(Hook):
+            def request_start(self, request) -> str:
+                return "request"
+
+            def request_end(self, context, request, webhook, status,
+                            duration) -> None:
+                events.append((context, webhook.id, status))
+
+            def listener_end(self, context, webhook, func, duration,
+                             error) -> None:
+                events.append(("listener", webhook.data.name, error))
+
+            def outbound_end(self, context, method, route, webhook,
+                             status, duration) -> None:
+                events.append(
+                    ("outbound", webhook and webhook.id, method, status)
+                )
+
+        class BrokenCache(MemoryInteractionCache):
+            async def claim(self, interaction_id: str):
+                raise RuntimeError()
+
+        @self.slash_cord.listener(self.command)
+        async def testing(webhook: WebhookModel) -> Message:
+            await self.slash_cord.create_followup_message(
+                webhook.token, Message("Hi")
+            )
+            return Message("Traced")
+
+        await self.start()
+        self.slash_cord.add_hook(Recorder())
+
+        await self.interact()
+        await self.slash_cord.create_followup_message("abc", Message("Hi"))
+
+        self.slash_cord._server._interactions = BrokenCache()
+        body, headers = self.sign(id="2")
+        async with self.session.post(
+                self.url, data=body, headers=headers) as resp:
+            self.assertEqual(resp.status, 500)
+
+        self.assertEqual(events, [
+            ("outbound", "1", "POST", 200),
+            ("listener", "testing", None),
+            ("request", "1", 200),
+            ("outbound", None, "POST", 200),
+            ("request", "2", 500)
+        ])
+
+
+class TestWorkers(asynctest.TestCase):
+    async def setUp(self) -> None:
+        self.discord = FakeDiscord()
+        await self.discord.start()
+
+    async def tearDown(self) -> None:
+        await self.discord.close()
+
+    async def test_serves(self) -> None:
+        signing_key = SigningKey.generate()
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        def run() -> None:
+            slash_cord = SlashCord(
+                token="",
+                client_id=0,
+                public_key=signing_key.verify_key.encode().hex(),
+                webhook_server=WebhookServer("127.0.0.1", port),
+                http_client=HttpClientConfig(base_url=self.discord.base_url)
+            )
+
+            @slash_cord.listener(
+                Command("testing", "Command created by SlashCord")
+            )
+            async def testing(webhook: WebhookModel) -> Message:
+                return Message(str(os.getpid()))
+
+            slash_cord.run_workers(
+                2, health_interval=0.1, shutdown_timeout=1.0
+            )
+
+        supervisor = multiprocessing.get_context("fork").Process(target=run)
+        supervisor.start()
+
+        body = json.dumps({
+            "id": "1", "type": 2, "token": "abc",
+            "data": {"id": "0", "name": "testing"}
+        }).encode()
+        timestamp = str(int(time.time()))
+        headers = {
+            "X-Signature-Ed25519": signing_key.sign(
+                timestamp.encode() + body
+            ).signature.hex(),
+            "X-Signature-Timestamp": timestamp,
+            "Content-Type": "application/json"
+        }
+
+        data = None
+        deadline = time.time() + 10
+        async with ClientSession() as session:
+            while data is None and time.time() < deadline:
+                try:
+                    async with session.post(
+                            "http://127.0.0.1:{}/".format(port),
+                            data=body, headers=headers) as resp:
+                        data = await resp.json()
+                except ClientError:
+                    await asyncio.sleep(0.1)
+
+        os.kill(supervisor.pid, signal.SIGTERM)
+        await asyncio.get_event_loop().run_in_executor(
+            None, supervisor.join, 10
+        )
+
+        self.assertEqual(data["type"], 4)
+        # Answered by a worker, not the supervisor.
+        self.assertNotEqual(data["data"]["content"], str(supervisor.pid))
+        # Commands are registered once, before forking.
+        self.assertEqual(
+            [method for method, _ in self.discord.requests], ["PUT"]
+        )
+        self.assertEqual(supervisor.exitcode, 0)
+
+    def test_backoff(self) -> None:
+        class Crashing(WorkerSupervisor):
+            def _serve(self, heartbeat) -> None:
+                os._exit(1)
+
+        supervisor = Crashing(None, 1, health_interval=0.05)
+        supervisor._workers = [supervisor._spawn()]
+
+        for failures in (1, 2):
+            worker = supervisor._workers[0]
+            worker.process.join()
+
+            supervisor._check_health()
+            self.assertIs(supervisor._workers[0], worker)
+            self.assertEqual(worker.failures, failures)
+
+            # Respawned once the growing delay passes.
+            delay = worker.restart_at - time.time()
+            self.assertGreater(delay, 0.05 * failures)
+            time.sleep(delay)
+
+            supervisor._check_health()
+            self.assertIsNot(supervisor._workers[0], worker)
+
+        supervisor._workers[0].process.join()